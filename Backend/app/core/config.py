@@ -1,22 +1,84 @@
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
 ALGORITHM = "HS256"
+JWKS_REFRESH_SECONDS = int(os.getenv("JWKS_REFRESH_SECONDS", "600"))
+# In-process caches are invalidated only in the worker that made the change; the TTLs
+# bound how long other workers can keep serving the old value
+ROLE_CACHE_TTL_SECONDS = int(os.getenv("ROLE_CACHE_TTL_SECONDS", "60"))
+DECISION_CACHE_MAX_SIZE = int(os.getenv("DECISION_CACHE_MAX_SIZE", "10000"))
+DECISION_CACHE_TTL_SECONDS = int(os.getenv("DECISION_CACHE_TTL_SECONDS", "30"))
+# Write coalescing for PATCH /options/{id}: buffer updates this long per user and apply
+# them in one statement (0 disables); a user's batch flushes early at OPTION_WRITE_MAX_BATCH
+OPTION_WRITE_COALESCE_MS = float(os.getenv("OPTION_WRITE_COALESCE_MS", "0"))
+OPTION_WRITE_MAX_BATCH = int(os.getenv("OPTION_WRITE_MAX_BATCH", "100"))
+# Change feed (/decisions/stream): per-subscriber queue bound, heartbeat interval and
+# how long one stream stays open before the client has to reconnect
+CHANGE_FEED_QUEUE_SIZE = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "256"))
+CHANGE_FEED_HEARTBEAT_SECONDS = float(os.getenv("CHANGE_FEED_HEARTBEAT_SECONDS", "15"))
+CHANGE_FEED_MAX_SECONDS = float(os.getenv("CHANGE_FEED_MAX_SECONDS", "600"))
+# Keep-alive connections to Supabase opened in the background during startup
+STARTUP_WARM_CONNECTIONS = int(os.getenv("STARTUP_WARM_CONNECTIONS", "4"))
+
+# Logging: LOG_LEVELS overrides single loggers, e.g. "app.core.security=WARNING,app.db=DEBUG".
+# httpx logs every Supabase round trip at INFO, so its loggers default to WARNING.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = {
+    "httpx": "WARNING",
+    "httpcore": "WARNING",
+    **{
+        name.strip(): level.strip().upper()
+        for name, _, level in (
+            item.partition("=") for item in os.getenv("LOG_LEVELS", "").split(",") if "=" in item
+        )
+    },
+}
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+LOG_RATE_LIMIT = int(os.getenv("LOG_RATE_LIMIT", "20"))
+LOG_RATE_WINDOW_SECONDS = float(os.getenv("LOG_RATE_WINDOW_SECONDS", "10"))
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
+# Database call tracing: flag requests issuing more than DB_TRACE_MAX_QUERIES calls or
+# repeating one query shape more than DB_TRACE_REPEAT_LIMIT times; strict mode raises
+DB_TRACE_ENABLED = os.getenv("DB_TRACE_ENABLED", "true").lower() == "true"
+DB_TRACE_MAX_QUERIES = int(os.getenv("DB_TRACE_MAX_QUERIES", "20"))
+DB_TRACE_REPEAT_LIMIT = int(os.getenv("DB_TRACE_REPEAT_LIMIT", "2"))
+DB_TRACE_STRICT = os.getenv("DB_TRACE_STRICT", "false").lower() == "true"
+
+
+# Rate limiting: per route class "burst:refill per second" token buckets, keyed by user
+# (or client IP for unauthenticated auth routes), e.g. "read=120:20,write=60:5,auth=10:0.2"
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMITS = {
+    "read": (120.0, 20.0),
+    "write": (60.0, 5.0),
+    "auth": (10.0, 0.2),
+    **{
+        name.strip(): tuple(float(part) for part in limit.split(":", 1))
+        for name, _, limit in (
+            item.partition("=") for item in os.getenv("RATE_LIMITS", "").split(",") if ":" in item
+        )
+    },
+}
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# Load shedding: answer 503 while more than SHED_MAX_IN_FLIGHT requests are running or
+# the mean latency over the last SHED_WINDOW_SECONDS exceeds SHED_LATENCY_MS (0 disables)
+SHED_MAX_IN_FLIGHT = int(os.getenv("SHED_MAX_IN_FLIGHT", "256"))
+SHED_LATENCY_MS = float(os.getenv("SHED_LATENCY_MS", "2000"))
+SHED_WINDOW_SECONDS = float(os.getenv("SHED_WINDOW_SECONDS", "10"))
+
 
-# Validate required environment variables
-if not SUPABASE_URL:
-    print("⚠️  WARNING: SUPABASE_URL environment variable not set")
-else:
-    print(f"✓ SUPABASE_URL configured: {SUPABASE_URL[:30]}...")
-
-if not SUPABASE_SERVICE_ROLE_KEY:
-    print("⚠️  WARNING: SUPABASE_SERVICE_ROLE_KEY environment variable not set")
-else:
-    print(f"✓ SUPABASE_SERVICE_ROLE_KEY configured: {len(SUPABASE_SERVICE_ROLE_KEY)} chars")
-
-if not SUPABASE_JWT_SECRET:
-    print("⚠️  WARNING: SUPABASE_JWT_SECRET environment variable not set")
-else:
-    print(f"✓ SUPABASE_JWT_SECRET configured: {len(SUPABASE_JWT_SECRET)} chars")
\ No newline at end of file
+def log_config_warnings() -> None:
+    """Validate required environment variables (called once logging is configured)"""
+    for name, value in (
+        ("SUPABASE_URL", SUPABASE_URL),
+        ("SUPABASE_SERVICE_ROLE_KEY", SUPABASE_SERVICE_ROLE_KEY),
+        ("SUPABASE_JWT_SECRET", SUPABASE_JWT_SECRET),
+    ):
+        if not value:
+            logger.warning("%s environment variable not set", name)
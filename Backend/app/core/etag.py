@@ -0,0 +1,41 @@
+import hashlib
+import json
+from fastapi import Request, Response, status
+
+
+def option_versions(options: list[dict]) -> list:
+    return sorted((str(option["id"]), str(option.get("updated_at"))) for option in options)
+
+
+def decision_version(decision: dict) -> list:
+    """Version tuple of a decision: its updated_at plus each option's (id, updated_at)"""
+    return [
+        str(decision["id"]),
+        str(decision.get("updated_at")),
+        option_versions(decision.get("options") or decision.get("decision_options") or []),
+    ]
+
+
+def page_etag(decisions: list[dict], next_cursor: str | None) -> str:
+    """Validator for one page of the decision list"""
+    return compute_etag([[decision_version(d) for d in decisions], next_cursor])
+
+
+def compute_etag(version) -> str:
+    digest = hashlib.sha1(json.dumps(version, separators=(",", ":")).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of `etag` against the request's If-None-Match header"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,153 @@
+import asyncio
+import itertools
+import json
+import logging
+import signal
+import threading
+from collections import defaultdict
+from typing import AsyncIterator
+from app.core.config import (
+    CHANGE_FEED_HEARTBEAT_SECONDS,
+    CHANGE_FEED_MAX_SECONDS,
+    CHANGE_FEED_QUEUE_SIZE,
+)
+from app.core.metrics import change_events_total, change_feed_subscribers
+
+logger = logging.getLogger(__name__)
+
+# Sent instead of the events a slow subscriber missed: its local state is stale
+RESYNC_EVENT = "resync"
+# Signals the server stops on; open streams end as soon as one arrives
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+class ChangeFeed:
+    """In-process pub/sub of per-user change events, one bounded queue per subscriber.
+
+    Publishing never blocks: when a subscriber's queue is full its backlog is
+    replaced by a single `resync` event telling the client to refetch. Events only
+    reach subscribers connected to the same worker process.
+    """
+
+    def __init__(self, queue_size: int = CHANGE_FEED_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._ids = itertools.count(1)
+        self.closed = False
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        change_feed_subscribers.inc()
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is not None and queue in queues:
+            queues.discard(queue)
+            change_feed_subscribers.dec()
+            if not queues:
+                del self._subscribers[user_id]
+
+    def publish(self, user_id: str, event_type: str, data: dict) -> None:
+        """Queue an event for every open stream of the user"""
+        queues = self._subscribers.get(user_id)
+        if not queues:
+            return
+        event = {"id": next(self._ids), "type": event_type, "data": data}
+        for queue in queues:
+            try:
+                queue.put_nowait(event)
+                change_events_total.inc("delivered")
+            except asyncio.QueueFull:
+                change_events_total.inc("dropped", amount=queue.qsize() + 1)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"id": event["id"], "type": RESYNC_EVENT, "data": {}})
+
+    def close(self) -> None:
+        """End every open stream and refuse new ones (server shutdown)"""
+        self.closed = True
+        for queues in self._subscribers.values():
+            for queue in queues:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+
+change_feed = ChangeFeed()
+
+
+def close_on_shutdown_signal() -> None:
+    """Close the feed as soon as the server is told to stop, then run its own handler.
+
+    The server drains open connections before lifespan shutdown starts, so closing
+    the feed there would keep shutdown waiting on every stream's max lifetime.
+    Signal handlers can only be installed from the main thread; elsewhere (test
+    clients) this is a no-op and lifespan shutdown closes the feed instead.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+    for sig in SHUTDOWN_SIGNALS:
+        previous = signal.getsignal(sig)
+        if not callable(previous):
+            continue
+
+        def handler(signum, frame, previous=previous):
+            loop.call_soon_threadsafe(change_feed.close)
+            previous(signum, frame)
+
+        signal.signal(sig, handler)
+
+
+def publish_options(user_id: str, event_type: str, rows: list[dict]) -> None:
+    """Publish option rows as one event per decision they belong to"""
+    by_decision = defaultdict(list)
+    for row in rows:
+        by_decision[str(row["decision_id"])].append(row)
+    for decision_id, options in by_decision.items():
+        if event_type == "option.deleted":
+            change_feed.publish(user_id, event_type, {
+                "decision_id": decision_id,
+                "option_ids": [str(option["id"]) for option in options],
+            })
+        else:
+            change_feed.publish(user_id, event_type, {"decision_id": decision_id, "options": options})
+
+
+def _format(event: dict) -> str:
+    data = json.dumps(event["data"], default=str, separators=(",", ":"))
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+async def event_stream(user_id: str) -> AsyncIterator[str]:
+    """Server-Sent Events for one subscriber, with heartbeats and a bounded lifetime.
+
+    The stream ends after CHANGE_FEED_MAX_SECONDS; EventSource-style clients reconnect
+    (and should refetch, as events published in between are not replayed).
+    """
+    if change_feed.closed:
+        return
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + CHANGE_FEED_MAX_SECONDS
+    queue = change_feed.subscribe(user_id)
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=min(CHANGE_FEED_HEARTBEAT_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle connection
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                break
+            yield _format(event)
+    finally:
+        change_feed.unsubscribe(user_id, queue)
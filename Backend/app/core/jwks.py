@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+import httpx
+from jwt import PyJWK, PyJWKSet
+from jwt.exceptions import PyJWKSetError
+from app.core.config import SUPABASE_URL, JWKS_REFRESH_SECONDS
+
+# Minimum gap between refreshes triggered by unknown `kid`s, so garbage tokens
+# cannot turn into a stream of JWKS fetches
+UNKNOWN_KID_REFRESH_COOLDOWN = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSKeyStore:
+    """In-memory `kid` -> signing key index, kept fresh by a background task.
+
+    Lookups never touch the network: a miss schedules a (single-flight) refresh
+    on the event loop and returns None straight away.
+    """
+
+    def __init__(self, jwks_url: str, refresh_interval: float = JWKS_REFRESH_SECONDS):
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self._keys: dict[str, PyJWK] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._schedule_task: asyncio.Task | None = None
+        self._last_refresh = 0.0
+
+    def get_signing_key(self, kid: str | None) -> PyJWK | None:
+        return self._keys.get(kid) if kid else None
+
+    async def start(self) -> None:
+        """Load the key set once, then keep refreshing it in the background"""
+        self._loop = asyncio.get_running_loop()
+        self._http_client = httpx.AsyncClient(timeout=httpx.Timeout(5.0))
+        await self.refresh()
+        self._schedule_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        for task in (self._schedule_task, self._refresh_task):
+            if task is not None:
+                task.cancel()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        self._schedule_task = self._refresh_task = self._http_client = None
+        self._loop = None
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS, sharing one in-flight fetch between concurrent callers"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+        await asyncio.shield(self._refresh_task)
+
+    def request_refresh(self) -> None:
+        """Schedule a refresh after an unknown `kid`; safe to call from any thread"""
+        if self._loop is None or time.monotonic() - self._last_refresh < UNKNOWN_KID_REFRESH_COOLDOWN:
+            return
+        self._loop.call_soon_threadsafe(self._start_refresh)
+
+    def _start_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                pass
+
+    async def _fetch(self) -> None:
+        self._last_refresh = time.monotonic()
+        try:
+            response = await self._http_client.get(self.jwks_url)
+            response.raise_for_status()
+            keys = {}
+            try:
+                for key in PyJWKSet.from_dict(response.json()).keys:
+                    if key.key_id:
+                        keys[key.key_id] = key
+            except PyJWKSetError:
+                # No usable asymmetric keys published (HS256-only project)
+                pass
+            # Swap the whole index at once so readers never see a partial set
+            self._keys = keys
+        except Exception as e:
+            logger.warning("JWKS refresh failed: %s", e)
+
+
+jwks_store = JWKSKeyStore(f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json")
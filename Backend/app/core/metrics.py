@@ -0,0 +1,251 @@
+import threading
+import time
+from bisect import bisect_left
+
+# Latency buckets in seconds, tuned for API calls (5 ms .. 10 s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: list["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram; per-label state is [bucket counts..., sum, count]"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = [(labels, list(state)) for labels, state in self._values.items()]
+        for labels, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            plain = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{plain} {state[-2]}")
+            lines.append(f"{self.name}_count{plain} {state[-1]}")
+        return lines
+
+
+class _CacheStats:
+    """Hit, miss and size figures read from registered `TTLCache`s at scrape time"""
+
+    def __init__(self):
+        self.caches: dict[str, object] = {}
+
+    def render(self) -> list[str]:
+        families = (
+            ("cache_hits_total", "counter", "Cache lookups served from memory", "hits"),
+            ("cache_misses_total", "counter", "Cache lookups that missed or had expired", "misses"),
+            ("cache_entries", "gauge", "Entries currently held", None),
+        )
+        lines = []
+        for name, kind, documentation, attribute in families:
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+            for cache_name, cache in self.caches.items():
+                value = getattr(cache, attribute) if attribute else len(cache)
+                lines.append(f'{name}{{cache="{_escape(cache_name)}"}} {value}')
+        return lines
+
+
+_cache_stats = _CacheStats()
+
+
+def register_cache(name: str, cache) -> None:
+    """Export a cache's hit/miss counters and size on /metrics"""
+    _cache_stats.caches[name] = cache
+
+
+def render_metrics() -> str:
+    """All registered metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    if _cache_stats.caches:
+        lines.extend(_cache_stats.render())
+    return "\n".join(lines) + "\n"
+
+
+http_requests_total = Counter(
+    "http_requests_total", "HTTP requests handled, by route and status", ("method", "route", "status")
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled", ("method",)
+)
+jwt_verify_duration_seconds = Histogram(
+    "jwt_verify_duration_seconds", "Time spent in verify_jwt", ("result",),
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05),
+)
+db_request_duration_seconds = Histogram(
+    "db_request_duration_seconds", "Supabase HTTP call latency", ("method", "target")
+)
+db_requests_total = Counter(
+    "db_requests_total", "Supabase HTTP calls, by target and status", ("method", "target", "status")
+)
+
+rejected_requests_total = Counter(
+    "rejected_requests_total", "Requests refused by rate limiting or load shedding",
+    ("route_class", "reason"),
+)
+
+singleflight_calls_total = Counter(
+    "singleflight_calls_total",
+    "Coalesced reads: `leader` calls reached the database, `coalesced` ones shared a leader's result",
+    ("query", "role"),
+)
+
+option_writes_total = Counter(
+    "option_writes_total",
+    "Coalesced option updates: `buffered` requests against `flushed` rows and `batches` sent",
+    ("stage",),
+)
+
+change_events_total = Counter(
+    "change_events_total", "Change feed events queued for subscribers, or dropped on overflow", ("result",)
+)
+change_feed_subscribers = Gauge(
+    "change_feed_subscribers", "Open /decisions/stream connections"
+)
+
+
+def db_target(path: str) -> str:
+    """Low-cardinality label for a Supabase URL path: the table, `rpc/<fn>`, or the service"""
+    parts = path.strip("/").split("/")
+    if len(parts) >= 3 and parts[0] == "rest":
+        return "/".join(parts[2:4]) if parts[2] == "rpc" else parts[2]
+    return parts[0] or "unknown"
+
+
+async def _start_db_timer(request) -> None:
+    request.extensions["metrics_start"] = time.perf_counter()
+
+
+async def _record_db_timing(response) -> None:
+    request = response.request
+    start = request.extensions.get("metrics_start")
+    if start is None:
+        return
+    target = db_target(request.url.path)
+    db_request_duration_seconds.observe(time.perf_counter() - start, request.method, target)
+    db_requests_total.inc(request.method, target, str(response.status_code))
+
+
+# httpx event hooks for the shared Supabase client; the response hook runs once
+# headers arrive, so timings cover the round trip but not body decoding
+DB_EVENT_HOOKS = {"request": [_start_db_timer], "response": [_record_db_timing]}
+
+
+def route_template(scope) -> str:
+    """Path template of the route that handled the request, including router prefixes"""
+    # FastAPI records the prefixed path of included routes here; `scope["route"]`
+    # only carries the path relative to its router
+    context = (scope.get("fastapi") or {}).get("effective_route_context")
+    path = getattr(context, "path", None) or getattr(scope.get("route"), "path", None)
+    return path or "unmatched"
+
+
+class MetricsMiddleware:
+    """Record count, status, latency and in-flight requests for every HTTP route.
+
+    Routes are labelled by their path template (`/api/v1/decisions/{decision_id}`),
+    and requests that match no route share the `unmatched` label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec(method)
+            route = route_template(scope)
+            http_request_duration_seconds.observe(time.perf_counter() - start, method, route)
+            http_requests_total.inc(method, route, str(status_code))
\ No newline at end of file
@@ -0,0 +1,204 @@
+import math
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from starlette.responses import JSONResponse
+from app.core.config import (
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMITS,
+    SHED_LATENCY_MS,
+    SHED_MAX_IN_FLIGHT,
+    SHED_WINDOW_SECONDS,
+)
+from app.core.metrics import rejected_requests_total
+from app.core.security import token_cache
+
+API_PREFIX = "/api/v1"
+
+# Probes and scrapes are never limited or shed
+EXEMPT_PATHS = {"/", "/ready", "/metrics"}
+# Long-lived streams and bulk transfers are rate limited on connect but left out
+# of the in-flight count and latency window, which they would otherwise dominate:
+# one multi-second export must not get other users' requests shed
+STREAMING_PATHS = {
+    f"{API_PREFIX}/decisions/stream",
+    f"{API_PREFIX}/decisions/export",
+    f"{API_PREFIX}/decisions/import",
+}
+
+# (method or None for any, path under API_PREFIX, route class, cost); first match wins.
+# Costs roughly follow the number of Supabase calls a request fans out into.
+ROUTE_RULES = [
+    ("POST", re.compile(r"/auth/(login|register|refresh)"), "auth", 1),
+    ("GET", re.compile(r"/decisions/export"), "read", 10),
+    ("POST", re.compile(r"/decisions/import"), "write", 10),
+    ("GET", re.compile(r"/decisions/(summary|search)"), "read", 3),
+    ("GET", re.compile(r"/decisions/?"), "read", 3),
+    (None, re.compile(r"/options/(bulk|bulk-delete)"), "write", 5),
+    ("GET", re.compile(r"/admin/users"), "read", 3),
+]
+
+
+def classify(method: str, path: str) -> tuple[str, int]:
+    """Route class and token cost of a request"""
+    relative = path.removeprefix(API_PREFIX)
+    for rule_method, pattern, route_class, cost in ROUTE_RULES:
+        if (rule_method is None or rule_method == method) and pattern.fullmatch(relative):
+            return route_class, cost
+    return ("read" if method in ("GET", "HEAD") else "write"), 1
+
+
+class TokenBucketLimiter:
+    """Token buckets per (route class, client key), kept in a bounded LRU.
+
+    A bucket holds up to `burst` tokens and refills at `rate` tokens per second;
+    `take` returns 0 when the request may proceed, else seconds until it could.
+    """
+
+    def __init__(self, limits: dict[str, tuple[float, float]], max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.limits = limits
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[tuple, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, route_class: str, key: str, cost: float = 1) -> float:
+        burst, rate = self.limits[route_class]
+        cost = min(cost, burst)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get((route_class, key))
+            if bucket is None:
+                bucket = self._buckets[(route_class, key)] = [burst, now]
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end((route_class, key))
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return 0.0
+            return (cost - bucket[0]) / rate if rate > 0 else float("inf")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class LoadShedder:
+    """Tracks requests in flight and recent latencies to decide when to shed load.
+
+    Latencies older than `window` seconds drop out, so shedding on latency stops by
+    itself once the slow requests age out.
+    """
+
+    def __init__(self, max_in_flight: int = SHED_MAX_IN_FLIGHT, latency_ms: float = SHED_LATENCY_MS,
+                 window: float = SHED_WINDOW_SECONDS):
+        self.max_in_flight = max_in_flight
+        self.latency_ms = latency_ms
+        self.window = window
+        self.in_flight = 0
+        self._latencies: deque[tuple[float, float]] = deque()
+        self._latency_sum = 0.0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._latencies and now - self._latencies[0][0] > self.window:
+            self._latency_sum -= self._latencies.popleft()[1]
+
+    def mean_latency_ms(self) -> float:
+        with self._lock:
+            self._prune(time.monotonic())
+            return self._latency_sum / len(self._latencies) if self._latencies else 0.0
+
+    def overloaded(self) -> str | None:
+        """Why new requests should be shed right now (None if they should not)"""
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return "queue_depth"
+        if self.latency_ms and self.mean_latency_ms() > self.latency_ms:
+            return "latency"
+        return None
+
+    def record(self, duration_ms: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._latencies.append((now, duration_ms))
+            self._latency_sum += duration_ms
+            self._prune(now)
+
+
+limiter = TokenBucketLimiter(RATE_LIMITS)
+shedder = LoadShedder()
+
+
+def client_key(scope, route_class: str) -> str:
+    """Bucket key: the user id of an already verified token, else the client IP.
+
+    Only the verified-token cache is consulted, so picking a bucket never costs a
+    signature check: a flood of bad tokens is limited per IP before anything verifies
+    it. A valid token is cached by its first request, which counts against the IP.
+    """
+    if route_class != "auth":
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                payload = token_cache.get(token) if scheme.lower() == "bearer" and token else None
+                if payload and payload.get("sub"):
+                    return f"user:{payload['sub']}"
+                break
+    # Set from X-Forwarded-For by the server when it runs with --proxy-headers
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def _rejection(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class RateLimitMiddleware:
+    """Shed load globally, then apply per-client token buckets by route class.
+
+    Rejections are 503 (overloaded) or 429 (rate limited), both with `Retry-After`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not RATE_LIMIT_ENABLED or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        route_class, cost = classify(scope["method"], scope["path"])
+
+        reason = shedder.overloaded()
+        if reason is not None:
+            rejected_requests_total.inc(route_class, reason)
+            response = _rejection(503, "Server is overloaded, please retry shortly", 1)
+            await response(scope, receive, send)
+            return
+
+        retry_after = limiter.take(route_class, client_key(scope, route_class), cost)
+        if retry_after:
+            rejected_requests_total.inc(route_class, "rate_limit")
+            response = _rejection(429, "Too many requests", retry_after)
+            await response(scope, receive, send)
+            return
+
+        if scope["path"] in STREAMING_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        shedder.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            shedder.in_flight -= 1
+            shedder.record((time.perf_counter() - start) * 1000)
@@ -0,0 +1,61 @@
+from app.core.cache import TTLCache
+from app.core.config import ROLE_CACHE_TTL_SECONDS
+from app.core.metrics import register_cache
+from app.db.supabase import supabase
+
+VALID_ROLES = ("user", "admin")
+# Never granted on a token claim alone: the users table decides
+PRIVILEGED_ROLES = ("admin",)
+
+# user id -> role from the users table
+role_cache = TTLCache(max_size=10_000, ttl=ROLE_CACHE_TTL_SECONDS)
+register_cache("roles", role_cache)
+
+
+def role_from_claims(claims: dict | None) -> str | None:
+    """Read the role from a verified token payload or GoTrue `app_metadata`.
+
+    Supports a top-level `user_role` claim (custom access token hook) and
+    `app_metadata.role`, which only the service role can write.
+    """
+    if not claims:
+        return None
+    role = claims.get("user_role") or (claims.get("app_metadata") or {}).get("role")
+    return role if role in VALID_ROLES else None
+
+
+async def resolve_role(user_id: str, claims: dict | None = None) -> str | None:
+    """Resolve a user's role: token claim, then the role cache, then the users table.
+
+    An unprivileged claim is used as is, since it grants nothing. A privileged one is
+    confirmed against the users table (through the cache), so a demotion made there,
+    or on another worker, applies within ROLE_CACHE_TTL_SECONDS rather than lasting
+    until the token expires.
+    """
+    role = role_from_claims(claims)
+    if role and role not in PRIVILEGED_ROLES:
+        return role
+
+    role = role_cache.get(user_id)
+    if role:
+        return role
+
+    response = await (
+        supabase
+        .table("users")
+        .select("role")
+        .eq("id", user_id)
+        .maybe_single()
+        .execute()
+    )
+    if not response or not response.data:
+        return None
+
+    role = response.data["role"]
+    role_cache.set(user_id, role)
+    return role
+
+
+def invalidate_role(user_id: str) -> None:
+    """Forget the cached role, so this process rereads it from the users table"""
+    role_cache.pop(user_id)
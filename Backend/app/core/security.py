@@ -1,72 +1,145 @@
+import hashlib
+import logging
+import threading
 import time
-import requests
-from jwt import PyJWKClient, decode as jwt_decode, InvalidTokenError
+from collections import OrderedDict
+from jwt import decode as jwt_decode, get_unverified_header, InvalidTokenError
 from app.core.config import SUPABASE_JWT_SECRET, ALGORITHM, SUPABASE_URL
+from app.core.jwks import jwks_store
+from app.core.metrics import jwt_verify_duration_seconds
 
-# Cache the PyJWKClient per SUPABASE_URL
-_JWKS_CLIENT = None
-_JWKS_CLIENT_URL = None
+logger = logging.getLogger(__name__)
 
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256")
+TOKEN_CACHE_MAX_SIZE = 4096
 
-def _get_jwks_client() -> PyJWKClient:
-    global _JWKS_CLIENT, _JWKS_CLIENT_URL
-    jwks_url = f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json"
-    if _JWKS_CLIENT is None or _JWKS_CLIENT_URL != jwks_url:
-        _JWKS_CLIENT = PyJWKClient(jwks_url)
-        _JWKS_CLIENT_URL = jwks_url
-    return _JWKS_CLIENT
 
+class VerifiedTokenCache:
+    """Bounded LRU of verified token payloads, keyed by token digest and expiring at `exp`"""
 
-def verify_jwt(token: str) -> dict | None:
-    """Verify JWT token from Supabase.
+    def __init__(self, max_size: int = TOKEN_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
 
-    Strategy:
-    - First attempt HS256 verification using the legacy shared secret (`SUPABASE_JWT_SECRET`).
-    - If that fails and the token uses an asymmetric algorithm (RS*/ES*), fetch the JWKS
-      from Supabase and verify using the matching public key.
-    - Returns the decoded payload on success, or None on failure.
-    """
-    if not SUPABASE_URL:
-        print("ERROR: SUPABASE_URL not configured")
-        return None
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
 
-    # Try HS256 with legacy secret first (covers older projects)
-    if SUPABASE_JWT_SECRET:
-        try:
-            payload = jwt_decode(
-                token,
-                SUPABASE_JWT_SECRET,
-                algorithms=["HS256"],
-                audience="authenticated",
-                issuer=f"{SUPABASE_URL}/auth/v1",
-            )
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
             return payload
-        except InvalidTokenError as e:
-            # Not valid under HS256 - continue to try JWKS verification
-            print(f"HS256 verification failed: {str(e)}")
 
-    # Try JWKS (RS*/ES*). Use PyJWKClient to fetch the signing key.
+    def put(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            # Never cache tokens that do not expire
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (payload, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache()
+
+
+def _verify_hs256(token: str) -> dict | None:
+    if not SUPABASE_JWT_SECRET:
+        return None
     try:
-        jwks_client = _get_jwks_client()
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-        public_key = signing_key.key
-        payload = jwt_decode(
+        return jwt_decode(
             token,
-            public_key,
-            algorithms=["RS256", "ES256"],
+            SUPABASE_JWT_SECRET,
+            algorithms=["HS256"],
+            audience="authenticated",
+            issuer=f"{SUPABASE_URL}/auth/v1",
+        )
+    except InvalidTokenError as e:
+        logger.info("HS256 verification failed: %s", e)
+        return None
+
+
+def _verify_asymmetric(token: str, kid: str | None) -> dict | None:
+    # Keys come from the in-memory JWKS index; an unknown kid only schedules a refresh
+    signing_key = jwks_store.get_signing_key(kid)
+    if signing_key is None:
+        jwks_store.request_refresh()
+        logger.warning("JWKS verification failed: unknown signing key id %r", kid)
+        return None
+    try:
+        return jwt_decode(
+            token,
+            signing_key.key,
+            algorithms=list(ASYMMETRIC_ALGORITHMS),
             audience="authenticated",
             issuer=f"{SUPABASE_URL}/auth/v1",
         )
-        return payload
     except Exception as e:
         # Log details for debugging
-        print(f"JWKS/Asymmetric JWT verification failed: {str(e)}")
+        logger.info("JWKS/Asymmetric JWT verification failed: %s", e)
+        return None
+
 
-    # As a last resort try decoding without verification (debug only)
+def verify_jwt(token: str) -> dict | None:
+    """Verify JWT token from Supabase, timing each call (see `_verify_jwt`)"""
+    start = time.perf_counter()
+    result = "invalid"
     try:
-        payload = jwt_decode(token, options={"verify_signature": False})
-        print("Token decoded without signature verification - debugging only")
+        payload, result = _verify_jwt(token)
         return payload
-    except Exception as e:
-        print(f"Failed to decode token without verification: {str(e)}")
-        return None
\ No newline at end of file
+    finally:
+        jwt_verify_duration_seconds.observe(time.perf_counter() - start, result)
+
+
+def _verify_jwt(token: str) -> tuple[dict | None, str]:
+    """Verify JWT token from Supabase.
+
+    Strategy:
+    - Serve tokens that were already verified (and have not expired) from `token_cache`.
+    - Route by the token header's `alg`: HS256 is checked against the legacy shared secret
+      (`SUPABASE_JWT_SECRET`), RS256/ES256 against the `jwks_store` key matching the
+      header's `kid`. Key lookups never block on the JWKS endpoint.
+    - Returns the decoded payload (or None on failure) and a `cached`/`valid`/`invalid`
+      label for the latency metric.
+    """
+    if not SUPABASE_URL:
+        logger.error("SUPABASE_URL not configured")
+        return None, "invalid"
+
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached, "cached"
+
+    try:
+        header = get_unverified_header(token)
+    except InvalidTokenError as e:
+        logger.info("Malformed token header: %s", e)
+        return None, "invalid"
+
+    alg = header.get("alg")
+    payload = None
+    if alg == "HS256":
+        payload = _verify_hs256(token)
+    elif alg in ASYMMETRIC_ALGORITHMS:
+        payload = _verify_asymmetric(token, header.get("kid"))
+
+    if payload is None:
+        return None, "invalid"
+    token_cache.put(token, payload)
+    return payload, "valid"
\ No newline at end of file
@@ -0,0 +1,25 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+from app.schemas.decision import DecisionPageRecord
+from app.schemas.options import OptionRecord
+
+# Serializers compiled once at import. PostgREST rows are already JSON-typed, so
+# list endpoints skip per-field validation and let pydantic-core write the bytes
+# directly, keeping only the fields declared on the response models.
+decision_page_serializer = TypeAdapter(DecisionPageRecord)
+option_list_serializer = TypeAdapter(list[OptionRecord])
+
+
+def serialized_response(
+    serializer: TypeAdapter,
+    content,
+    status_code: int = 200,
+    headers: dict | None = None,
+) -> Response:
+    """Render `content` with a pre-compiled serializer into a JSON response"""
+    return Response(
+        content=serializer.dump_json(content, warnings=False),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
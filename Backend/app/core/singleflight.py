@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable
+from app.core.metrics import singleflight_calls_total
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers asking for the same key.
+
+    Keys are tuples whose first item names the query shape (used as the metric
+    label). The call runs as its own task, so a caller that disconnects does not
+    cancel it for the others; every caller receives the same result object.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple, asyncio.Task] = {}
+
+    async def do(self, key: tuple, fn: Callable[..., Awaitable], *args):
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn(*args))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            singleflight_calls_total.inc(key[0], "leader")
+        else:
+            singleflight_calls_total.inc(key[0], "coalesced")
+        return await asyncio.shield(task)
+
+    def _finish(self, key: tuple, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller went away
+            task.exception()
+
+    def forget(self, predicate: Callable[[tuple], bool]) -> None:
+        """Stop sharing matching in-flight calls, so later callers start a fresh one"""
+        for key in [key for key in self._calls if predicate(key)]:
+            del self._calls[key]
+
+
+# Reads keyed by (query shape, user id, ...); see app.db.decision_cache for invalidation
+coalesced_reads = SingleFlight()
\ No newline at end of file
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import time
+
+# Taken when app.main starts importing, so the report includes module import time
+_started = time.perf_counter()
+
+logger = logging.getLogger(__name__)
+
+
+class StartupState:
+    """Per-phase startup timings and the readiness flag behind `/ready`.
+
+    Phases are recorded in order: module imports, lifespan setup (client creation),
+    the initial JWKS fetch, then each background warm-up step. The app is ready
+    once warm-up has finished.
+    """
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.ready = False
+        self.errors: list[str] = []
+        self._last = _started
+        self._task: asyncio.Task | None = None
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the previous mark as `phase`"""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 1)
+        self._last = now
+
+    def report(self) -> dict:
+        return {
+            "ready": self.ready,
+            "total_ms": round(sum(self.phases.values()), 1),
+            "phases": dict(self.phases),
+            "errors": list(self.errors),
+        }
+
+    def warm_up(self, steps: dict) -> None:
+        """Run the named warm-up coroutine functions in the background, in order"""
+        self._task = asyncio.create_task(self._run(steps))
+
+    async def _run(self, steps: dict) -> None:
+        for name, step in steps.items():
+            try:
+                await step()
+            except Exception as e:
+                self.errors.append(f"{name}: {e}")
+                logger.warning("Warm-up step %s failed: %s", name, e)
+            self.mark(f"warm_up.{name}")
+        self.ready = True
+        report = self.report()
+        logger.info("Startup complete in %.1f ms", report["total_ms"], extra=report)
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+
+startup = StartupState()
\ No newline at end of file
@@ -0,0 +1,23 @@
+import re
+from app.db.supabase import supabase
+
+# Characters an email prefix filter may contain; anything else cannot appear in a
+# stored address and would otherwise have to be escaped for PostgREST
+_EMAIL_PREFIX = re.compile(r"^[A-Za-z0-9.@+_%-]+$")
+
+
+def email_prefix_pattern(prefix: str) -> str | None:
+    """LIKE pattern matching emails that start with `prefix` (None if it is not usable)"""
+    if not _EMAIL_PREFIX.match(prefix):
+        return None
+    # `_` and `%` are wildcards in LIKE; escape them so they match literally
+    escaped = prefix.lower().replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+async def fetch_user_activity(user_ids: list[str]) -> dict[str, dict]:
+    """Decision and option counts per user, aggregated by `user_activity_counts` in one call"""
+    if not user_ids:
+        return {}
+    response = await supabase.rpc("user_activity_counts", {"p_user_ids": user_ids}).execute()
+    return {row["user_id"]: row for row in response.data or []}
\ No newline at end of file
@@ -0,0 +1,56 @@
+import time
+from app.core.cache import TTLCache
+from app.core.config import DECISION_CACHE_MAX_SIZE, DECISION_CACHE_TTL_SECONDS
+from app.core.metrics import register_cache
+from app.core.singleflight import coalesced_reads
+from app.db.loaders import load_decision_with_options
+
+# Assembled decision-with-options documents keyed by (owner_id, decision_id)
+decision_cache = TTLCache(max_size=DECISION_CACHE_MAX_SIZE, ttl=DECISION_CACHE_TTL_SECONDS)
+register_cache("decisions", decision_cache)
+
+# When each key was last invalidated, so a read that started before a write
+# cannot put the pre-write document back into the cache
+_invalidated_at = TTLCache(max_size=DECISION_CACHE_MAX_SIZE, ttl=DECISION_CACHE_TTL_SECONDS)
+
+
+def cached_decision(decision_id: str, user_id: str) -> dict | None:
+    return decision_cache.get((user_id, decision_id))
+
+
+async def load_and_cache_decision(decision_id: str, user_id: str) -> dict | None:
+    """Load the decision with its options (after a cache miss) and cache the document.
+
+    Concurrent misses for the same decision share one load.
+    """
+    return await coalesced_reads.do(("decision", user_id, decision_id), _load_and_cache, decision_id, user_id)
+
+
+async def _load_and_cache(decision_id: str, user_id: str) -> dict | None:
+    key = (user_id, decision_id)
+    started_at = time.monotonic()
+    decision = await load_decision_with_options(decision_id, user_id)
+    if decision is not None and _invalidated_at.get(key, 0.0) < started_at:
+        decision_cache.set(key, decision)
+    return decision
+
+
+def invalidate_decision(user_id: str, decision_id: str | None) -> None:
+    """Drop one decision after it or any of its options changed"""
+    if decision_id is None:
+        return
+    key = (user_id, str(decision_id))
+    _invalidated_at.set(key, time.monotonic())
+    decision_cache.pop(key)
+    invalidate_user_reads(user_id)
+
+
+def invalidate_user_decisions(user_id: str) -> None:
+    """Drop every cached decision of a user (account deletion)"""
+    decision_cache.pop_matching(lambda key: key[0] == user_id)
+    invalidate_user_reads(user_id)
+
+
+def invalidate_user_reads(user_id: str) -> None:
+    """Stop sharing the user's in-flight reads with requests that arrive after a write"""
+    coalesced_reads.forget(lambda key: key[1] == user_id)
@@ -0,0 +1,97 @@
+from collections import defaultdict
+from app.db.pagination import paginate, page_result
+from app.db.supabase import supabase
+
+# Keep the `in.(...)` filter comfortably under PostgREST's URL length limit
+IN_FILTER_CHUNK_SIZE = 150
+
+
+async def load_options_for_decisions(decision_ids: list[str]) -> dict[str, list]:
+    """Fetch options for many decisions in one query, grouped by decision id"""
+    grouped = {decision_id: [] for decision_id in decision_ids}
+    if not decision_ids:
+        return grouped
+
+    # Rows arrive in created_at order, so appending keeps each group sorted
+    by_decision = defaultdict(list)
+    for start in range(0, len(decision_ids), IN_FILTER_CHUNK_SIZE):
+        chunk = decision_ids[start:start + IN_FILTER_CHUNK_SIZE]
+        response = await (
+            supabase
+            .table("decision_options")
+            .select("*")
+            .in_("decision_id", chunk)
+            .order("created_at", desc=False)
+            .execute()
+        )
+        for option in response.data or []:
+            by_decision[option["decision_id"]].append(option)
+
+    for decision_id in decision_ids:
+        grouped[decision_id] = by_decision.get(decision_id, [])
+    return grouped
+
+
+async def load_decision_with_options(
+    decision_id: str,
+    owner_id: str,
+    columns: str = "*",
+    option_columns: str = "*",
+) -> dict | None:
+    """Fetch an owned decision with its options embedded, in one query.
+
+    Returns None when the decision does not exist or belongs to someone else.
+    """
+    response = await (
+        supabase
+        .table("decisions")
+        .select(f"{columns}, decision_options({option_columns})")
+        .eq("id", decision_id)
+        .eq("owner_id", owner_id)
+        .order("created_at", desc=False, foreign_table="decision_options")
+        .limit(1)
+        .execute()
+    )
+    if not response.data:
+        return None
+
+    decision = response.data[0]
+    decision["options"] = decision.pop("decision_options", None) or []
+    return decision
+
+
+async def attach_options(decisions: list[dict]) -> list[dict]:
+    """Attach an `options` list to each decision using a single batched fetch"""
+    options_by_decision = await load_options_for_decisions(
+        [decision["id"] for decision in decisions]
+    )
+    for decision in decisions:
+        decision["options"] = options_by_decision.get(decision["id"], [])
+    return decisions
+
+
+
+async def load_decision_page(
+    owner_id: str,
+    limit: int | None,
+    cursor: str | None,
+    columns: str = "*",
+) -> tuple[list[dict], str | None]:
+    """One page of the owner's decisions, newest first, and the next page's cursor"""
+    query = (
+        supabase
+        .table("decisions")
+        .select(columns)
+        .eq("owner_id", owner_id)
+    )
+    response = await paginate(query, limit, cursor).execute()
+    return page_result(response.data or [], limit)
+
+
+async def load_decision_page_with_options(
+    owner_id: str, limit: int | None, cursor: str | None
+) -> tuple[list[dict], str | None]:
+    """A page of decisions with options attached, in two queries"""
+    decisions, next_cursor = await load_decision_page(owner_id, limit, cursor)
+    await attach_options(decisions)
+    return decisions, next_cursor
\ No newline at end of file
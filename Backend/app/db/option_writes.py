@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from uuid import UUID
+from app.core.config import OPTION_WRITE_COALESCE_MS, OPTION_WRITE_MAX_BATCH
+from app.core.events import publish_options
+from app.core.metrics import option_writes_total
+from app.db.decision_cache import invalidate_decision
+from app.db.supabase import supabase
+
+logger = logging.getLogger(__name__)
+
+
+class OptionWriteBuffer:
+    """Coalesce bursts of single-option updates into one statement per user.
+
+    Updates to the same option merge field by field, last writer wins. Every
+    caller waits for the flush that applied its update and gets the row as
+    written, so a request is only acknowledged once its change is stored.
+    """
+
+    def __init__(self, window_ms: float = OPTION_WRITE_COALESCE_MS, max_batch: int = OPTION_WRITE_MAX_BATCH):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        # user id -> option id -> {"changes": merged fields, "waiters": [futures]}
+        self._pending: dict[str, dict[str, dict]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._flushes: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    async def update(self, user_id: str, option_id: str, changes: dict) -> dict | None:
+        """Buffer `changes` to an owned option; returns the updated row, or None if not found"""
+        # Canonical form, so the id matches the one on the returned row
+        option_id = str(UUID(option_id))
+        loop = asyncio.get_running_loop()
+        entries = self._pending.setdefault(user_id, {})
+        entry = entries.setdefault(option_id, {"changes": {}, "waiters": []})
+        entry["changes"].update(changes)
+        future = loop.create_future()
+        entry["waiters"].append(future)
+        option_writes_total.inc("buffered")
+
+        if len(entries) >= self.max_batch:
+            self._start_flush(user_id)
+        elif user_id not in self._timers:
+            self._timers[user_id] = loop.call_later(self.window, self._start_flush, user_id)
+        return await future
+
+    def _start_flush(self, user_id: str) -> None:
+        timer = self._timers.pop(user_id, None)
+        if timer is not None:
+            timer.cancel()
+        entries = self._pending.pop(user_id, None)
+        if entries:
+            task = asyncio.create_task(self._flush(user_id, entries))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, user_id: str, entries: dict[str, dict]) -> None:
+        updates = [{"id": option_id, **entry["changes"]} for option_id, entry in entries.items()]
+        try:
+            # No decision scope: one user's burst may touch options of several decisions
+            response = await supabase.rpc("update_owned_options", {
+                "p_owner_id": user_id,
+                "p_decision_id": None,
+                "p_updates": updates,
+            }).execute()
+        except Exception as e:
+            logger.warning("Option write flush failed: %s", e, extra={"user_id": user_id})
+            for entry in entries.values():
+                for waiter in entry["waiters"]:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+            return
+
+        rows = {row["id"]: row for row in response.data or []}
+        option_writes_total.inc("batches")
+        option_writes_total.inc("flushed", amount=len(rows))
+        for decision_id in {row["decision_id"] for row in rows.values()}:
+            invalidate_decision(user_id, decision_id)
+        publish_options(user_id, "option.updated", list(rows.values()))
+        for option_id, entry in entries.items():
+            for waiter in entry["waiters"]:
+                if not waiter.done():
+                    waiter.set_result(rows.get(option_id))
+
+    async def flush_all(self) -> None:
+        """Apply every buffered update now and wait for it (app shutdown)"""
+        for user_id in list(self._pending):
+            self._start_flush(user_id)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+
+option_writes = OptionWriteBuffer()
\ No newline at end of file
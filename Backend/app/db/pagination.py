@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+# Columns a keyset cursor may sort on, with how a decoded cursor value is validated
+def _validate_timestamp(value: str) -> None:
+    datetime.fromisoformat(value)
+
+
+def _validate_text(value: str) -> None:
+    if '"' in value or "\\" in value:
+        raise ValueError("unsupported character in cursor")
+
+
+CURSOR_COLUMNS = {
+    "created_at": _validate_timestamp,
+    "email": _validate_text,
+}
+
+
+def encode_cursor(row: dict, column: str = "created_at") -> str:
+    """Encode the (column, id) keyset position of a row as an opaque cursor"""
+    raw = json.dumps([row[column], str(row["id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: str = "created_at") -> tuple[str, str]:
+    """Decode a cursor produced by `encode_cursor` back into (value, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        # Both values are interpolated into a PostgREST filter, so validate them strictly
+        CURSOR_COLUMNS[column](value)
+        return value, str(UUID(row_id))
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def clamp_limit(limit: int | None) -> int:
+    """Bound a client supplied page size to [1, MAX_PAGE_SIZE]"""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def paginate(query, limit: int | None, cursor: str | None, column: str = "created_at", desc: bool = True):
+    """Apply keyset ordering on (column, id) to a select query, newest first by default.
+
+    One extra row is requested so `page_result` can tell whether another page exists.
+    """
+    if cursor:
+        value, row_id = decode_cursor(cursor, column)
+        op = "lt" if desc else "gt"
+        query = query.or_(
+            f'{column}.{op}."{value}",'
+            f'and({column}.eq."{value}",id.{op}.{row_id})'
+        )
+
+    return (
+        query
+        .order(column, desc=desc)
+        .order("id", desc=desc)
+        .limit(clamp_limit(limit) + 1)
+    )
+
+
+def page_result(rows: list, limit: int | None, column: str = "created_at") -> tuple[list, str | None]:
+    """Split the over-fetched rows into the page items and the next cursor"""
+    page_size = clamp_limit(limit)
+    items = rows[:page_size]
+    next_cursor = encode_cursor(items[-1], column) if len(rows) > page_size else None
+    return items, next_cursor
\ No newline at end of file
@@ -0,0 +1,42 @@
+import re
+from app.db.pagination import clamp_limit
+from app.db.supabase import supabase
+
+MAX_SEARCH_TERMS = 8
+MAX_SEARCH_OFFSET = 1000
+
+# Letters and digits only: everything else (including tsquery operators) separates terms
+_TERM = re.compile(r"[^\W_]+")
+
+
+def build_tsquery(text: str) -> str | None:
+    """Turn free text into a to_tsquery expression: every term required, prefix matched"""
+    terms = _TERM.findall(text.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+async def search_decisions(
+    user_id: str, text: str, limit: int | None, offset: int
+) -> tuple[list[dict], int | None]:
+    """Rank the user's decisions against `text` via the GIN-indexed `search_decisions` function.
+
+    Returns one page of hits and the offset of the next page (None on the last page).
+    """
+    query = build_tsquery(text)
+    if query is None:
+        return [], None
+
+    limit = clamp_limit(limit)
+    response = await supabase.rpc("search_decisions", {
+        "p_owner_id": user_id,
+        "p_query": query,
+        "p_limit": limit + 1,
+        "p_offset": offset,
+    }).execute()
+
+    rows = response.data or []
+    if len(rows) > limit:
+        return rows[:limit], offset + limit
+    return rows, None
@@ -0,0 +1,50 @@
+import asyncio
+from app.db.supabase import supabase
+
+STAT_KEYS = ("total_users", "total_admins", "total_decisions", "total_options")
+
+
+async def _count(table: str, **filters) -> int:
+    query = supabase.table(table).select("id", count="exact", head=True)
+    for column, value in filters.items():
+        query = query.eq(column, value)
+    response = await query.execute()
+    return response.count or 0
+
+
+async def count_live() -> dict[str, int]:
+    """Count rows directly, running the four counts concurrently"""
+    users, admins, decisions, options = await asyncio.gather(
+        _count("users"),
+        _count("users", role="admin"),
+        _count("decisions"),
+        _count("decision_options"),
+    )
+    return {
+        "total_users": users,
+        "total_admins": admins,
+        "total_decisions": decisions,
+        "total_options": options,
+    }
+
+
+async def fetch_dashboard_stats() -> dict[str, int]:
+    """Read the trigger-maintained counters from `app_stats` in one indexed query.
+
+    Falls back to live counts if the counter table has not been provisioned yet.
+    """
+    try:
+        response = await (
+            supabase
+            .table("app_stats")
+            .select("key, value")
+            .in_("key", list(STAT_KEYS))
+            .execute()
+        )
+        stats = {row["key"]: row["value"] for row in response.data or []}
+        if all(key in stats for key in STAT_KEYS):
+            return {key: max(int(stats[key]), 0) for key in STAT_KEYS}
+    except Exception:
+        pass
+
+    return await count_live()
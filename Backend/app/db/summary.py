@@ -0,0 +1,47 @@
+from app.db.supabase import supabase
+
+RATING_SCALE = 5
+
+
+async def fetch_decision_summaries(user_id: str) -> list[dict]:
+    """Per-decision rating aggregates, computed by `decision_rating_summaries` in SQL"""
+    response = await supabase.rpc("decision_rating_summaries", {"p_owner_id": user_id}).execute()
+    return response.data or []
+
+
+def median_from_counts(rating_counts: list[int]) -> float | None:
+    """Median rating of a 1..N histogram, without expanding it into individual ratings"""
+    total = sum(rating_counts)
+    if not total:
+        return None
+
+    def rating_at(position: int) -> int:
+        seen = 0
+        for rating, count in enumerate(rating_counts, start=1):
+            seen += count
+            if position < seen:
+                return rating
+
+    return (rating_at((total - 1) // 2) + rating_at(total // 2)) / 2
+
+
+def summarize_totals(summaries: list[dict]) -> dict:
+    """Totals across all decisions, merged from the per-decision histograms"""
+    rating_counts = [0] * RATING_SCALE
+    options = unrated = 0
+    for summary in summaries:
+        options += summary["option_count"]
+        unrated += summary["unrated_count"]
+        for index, count in enumerate(summary["rating_counts"] or []):
+            rating_counts[index] += count
+
+    rated = sum(rating_counts)
+    rating_sum = sum(rating * count for rating, count in enumerate(rating_counts, start=1))
+    return {
+        "decisions": len(summaries),
+        "options": options,
+        "unrated": unrated,
+        "mean_rating": round(rating_sum / rated, 2) if rated else None,
+        "median_rating": median_from_counts(rating_counts),
+        "rating_counts": rating_counts,
+    }
@@ -1,7 +1,112 @@
-from supabase import create_client
-from app.core.config import SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+import asyncio
+from typing import TYPE_CHECKING
+import httpx
+from app.core.config import SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, STARTUP_WARM_CONNECTIONS
+from app.core.metrics import DB_EVENT_HOOKS
+from app.db.tracing import DB_TRACE_HOOKS
 
-supabase = create_client(
-    SUPABASE_URL,
-    SUPABASE_SERVICE_ROLE_KEY
-)
\ No newline at end of file
+if TYPE_CHECKING:
+    from supabase import AsyncClient, ASupabaseAuthClient
+
+# Shared keep-alive pool used by every Supabase sub-client (PostgREST, auth, storage)
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+# Per-call metrics and per-request tracing, run around every Supabase HTTP call
+HTTP_EVENT_HOOKS = {
+    event: DB_EVENT_HOOKS[event] + DB_TRACE_HOOKS[event] for event in ("request", "response")
+}
+
+_client: "AsyncClient | None" = None
+_user_auth: "ASupabaseAuthClient | None" = None
+_http_client: httpx.AsyncClient | None = None
+
+
+async def connect_supabase(transport: httpx.AsyncBaseTransport | None = None) -> "AsyncClient":
+    """Create the async Supabase client and its pooled HTTP client (app startup).
+
+    No network I/O happens here; see `warm_connections`. `transport` replaces the
+    network layer, e.g. with the benchmarks' in-memory backend.
+    """
+    global _client, _user_auth, _http_client
+    if _client is None:
+        # supabase pulls in postgrest, gotrue, storage and realtime; importing it here
+        # keeps it out of module import time
+        from supabase import AsyncClientOptions, ASupabaseAuthClient, acreate_client
+
+        _http_client = httpx.AsyncClient(
+            limits=HTTP_POOL_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            event_hooks=HTTP_EVENT_HOOKS,
+            transport=transport,
+        )
+        _client = await acreate_client(
+            SUPABASE_URL,
+            SUPABASE_SERVICE_ROLE_KEY,
+            options=AsyncClientOptions(httpx_client=_http_client),
+        )
+        # Users sign in on their own GoTrue client: a sign-in on `_client.auth` would
+        # switch the shared client's Authorization header to that user's token
+        _user_auth = ASupabaseAuthClient(
+            url=f"{SUPABASE_URL}/auth/v1",
+            headers={
+                "apikey": SUPABASE_SERVICE_ROLE_KEY,
+                "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
+            },
+            auto_refresh_token=False,
+            persist_session=False,
+            http_client=_http_client,
+        )
+    return _client
+
+
+async def warm_connections(count: int = STARTUP_WARM_CONNECTIONS) -> None:
+    """Open `count` keep-alive connections (TCP + TLS) so early requests skip the handshakes"""
+    if _http_client is None:
+        raise RuntimeError("Supabase client is not initialised")
+
+    async def ping():
+        response = await _http_client.get(
+            f"{SUPABASE_URL}/auth/v1/health", headers={"apikey": SUPABASE_SERVICE_ROLE_KEY}
+        )
+        response.raise_for_status()
+
+    # Concurrent requests cannot share a connection, so each one opens its own
+    await asyncio.gather(*(ping() for _ in range(count)))
+
+
+async def close_supabase() -> None:
+    """Release the pooled connections (app shutdown)"""
+    global _client, _user_auth, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _client = None
+    _user_auth = None
+    _http_client = None
+
+
+def get_supabase() -> "AsyncClient":
+    """Return the client created by `connect_supabase`"""
+    if _client is None:
+        raise RuntimeError("Supabase client is not initialised; is the app lifespan running?")
+    return _client
+
+
+def get_user_auth() -> "ASupabaseAuthClient":
+    """Return the session-less GoTrue client for user sign-up, sign-in and refresh"""
+    if _user_auth is None:
+        raise RuntimeError("Supabase client is not initialised; is the app lifespan running?")
+    return _user_auth
+
+
+class _SupabaseProxy:
+    """Forward attribute access to the live client so modules can keep importing `supabase`"""
+
+    def __init__(self, get_client=get_supabase):
+        self._get_client = get_client
+
+    def __getattr__(self, name):
+        return getattr(self._get_client(), name)
+
+
+supabase = _SupabaseProxy()
+user_auth = _SupabaseProxy(get_user_auth)
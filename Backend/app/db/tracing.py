@@ -0,0 +1,176 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from app.core.config import (
+    DB_TRACE_ENABLED,
+    DB_TRACE_MAX_QUERIES,
+    DB_TRACE_REPEAT_LIMIT,
+    DB_TRACE_STRICT,
+)
+from app.core.metrics import db_target, route_template
+
+logger = logging.getLogger(__name__)
+
+# PostgREST query parameters that shape the result rather than filter rows
+_NON_FILTER_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+
+class NPlusOneError(RuntimeError):
+    """Raised in strict mode when a request's database calls look like an N+1 pattern"""
+
+
+class RequestTrace:
+    """Database spans recorded while handling one HTTP request"""
+
+    def __init__(self, method: str):
+        self.method = method
+        self.spans: list[dict] = []
+        self.allow_repeats = False
+
+    @property
+    def db_ms(self) -> float:
+        return sum(span["duration_ms"] for span in self.spans)
+
+    def problems(self, max_queries: int, repeat_limit: int) -> list[str]:
+        """Describe why this request looks like an N+1 pattern (empty if it does not)"""
+        if self.allow_repeats:
+            return []
+        problems = []
+        if len(self.spans) > max_queries:
+            problems.append(f"{len(self.spans)} database calls (limit {max_queries})")
+        shapes = Counter(span["shape"] for span in self.spans)
+        for shape, count in shapes.items():
+            if count > repeat_limit:
+                problems.append(f"{count}x {shape}")
+        return problems
+
+
+trace_var: ContextVar[RequestTrace | None] = ContextVar("db_trace", default=None)
+
+
+def allow_repeated_queries() -> None:
+    """Mark the current request as an intentional batch loop (export, import, ...).
+
+    Its call count scales with the data, so neither the query-count limit nor the
+    repeated-shape check applies; the query summary is still logged.
+    """
+    trace = trace_var.get()
+    if trace is not None:
+        trace.allow_repeats = True
+
+
+def _operation(request) -> str:
+    if request.url.path.startswith("/rest/"):
+        if "/rpc/" in request.url.path:
+            return "rpc"
+        if request.method == "POST":
+            prefer = request.headers.get("prefer", "")
+            return "upsert" if "resolution=" in prefer else "insert"
+        return {"GET": "select", "HEAD": "count", "PATCH": "update", "DELETE": "delete"}.get(
+            request.method, request.method.lower()
+        )
+    return request.method.lower()
+
+
+def _filters(request) -> list[str]:
+    """Filter columns and operators, without values (`owner_id=eq`)"""
+    filters = []
+    for key, value in request.url.params.multi_items():
+        if key not in _NON_FILTER_PARAMS:
+            filters.append(f"{key}={value.split('.', 1)[0]}")
+    return sorted(filters)
+
+
+def _row_count(response) -> int | None:
+    # PostgREST reports the returned range as `first-last/total` (or `*/total` if empty)
+    content_range = response.headers.get("content-range")
+    if not content_range:
+        return None
+    returned = content_range.split("/", 1)[0]
+    if returned == "*":
+        return 0
+    first, _, last = returned.partition("-")
+    try:
+        return int(last) - int(first) + 1
+    except ValueError:
+        return None
+
+
+async def _start_span(request) -> None:
+    if trace_var.get() is not None:
+        request.extensions["trace_start"] = time.perf_counter()
+
+
+async def _finish_span(response) -> None:
+    trace = trace_var.get()
+    request = response.request
+    start = request.extensions.get("trace_start")
+    if trace is None or start is None:
+        return
+
+    table = db_target(request.url.path)
+    operation = _operation(request)
+    filters = _filters(request)
+    span = {
+        "table": table,
+        "operation": operation,
+        "filters": filters,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+        "rows": _row_count(response),
+        "status": response.status_code,
+        # Identical for calls that differ only in filter values
+        "shape": f"{operation} {table}?{'&'.join(filters)} select={request.url.params.get('select', '')}",
+    }
+    trace.spans.append(span)
+    logger.debug("db %s %s", operation, table, extra={k: v for k, v in span.items() if k != "shape"})
+
+
+# httpx event hooks for the shared Supabase client: every `.execute()` is one HTTP call
+DB_TRACE_HOOKS = {"request": [_start_span], "response": [_finish_span]}
+
+
+def report(trace: RequestTrace, route: str, strict: bool = DB_TRACE_STRICT) -> None:
+    """Log the request's query summary, and flag (or in strict mode, fail) N+1 patterns"""
+    if not trace.spans:
+        return
+    summary = {"route": route, "query_count": len(trace.spans), "db_ms": round(trace.db_ms, 3)}
+    logger.info("%s %s issued %d database calls", trace.method, route, len(trace.spans), extra=summary)
+
+    problems = trace.problems(DB_TRACE_MAX_QUERIES, DB_TRACE_REPEAT_LIMIT)
+    if problems:
+        if strict:
+            raise NPlusOneError(f"{trace.method} {route}: " + "; ".join(problems))
+        logger.warning("Possible N+1 in %s %s: %s", trace.method, route, "; ".join(problems), extra=summary)
+
+
+class DBTracingMiddleware:
+    """Collect the database spans of each request and report them once it finishes.
+
+    Adds a `Server-Timing` header with the calls made before the response started.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not DB_TRACE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        trace = RequestTrace(scope["method"])
+        token = trace_var.set(trace)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and trace.spans:
+                timing = f'db;dur={trace.db_ms:.1f};desc="{len(trace.spans)} queries"'
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            trace_var.reset(token)
+        report(trace, route_template(scope))
\ No newline at end of file
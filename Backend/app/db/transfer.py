@@ -0,0 +1,116 @@
+import json
+from typing import AsyncIterator
+from pydantic import ValidationError
+from app.db.loaders import attach_options
+from app.db.pagination import MAX_PAGE_SIZE, paginate, page_result
+from app.db.supabase import supabase
+from app.db.tracing import allow_repeated_queries
+from app.schemas.decision import DecisionImport
+
+EXPORT_PAGE_SIZE = MAX_PAGE_SIZE
+IMPORT_BATCH_SIZE = 100
+MAX_IMPORT_LINE_BYTES = 1024 * 1024
+MAX_REPORTED_ERRORS = 100
+
+# Columns carried by an export line; ids are regenerated on import
+DECISION_EXPORT_FIELDS = ("id", "title", "description", "is_active", "created_at", "updated_at")
+OPTION_EXPORT_FIELDS = ("id", "option_text", "rating", "created_at", "updated_at")
+
+
+async def export_decisions(user_id: str) -> AsyncIterator[bytes]:
+    """Yield the user's decisions as NDJSON, one decision (with options) per line.
+
+    Pages through `decisions` with the keyset cursor, so memory is bounded by one page.
+    """
+    allow_repeated_queries()
+    cursor = None
+    while True:
+        query = supabase.table("decisions").select("*").eq("owner_id", user_id)
+        response = await paginate(query, EXPORT_PAGE_SIZE, cursor).execute()
+        decisions, cursor = page_result(response.data or [], EXPORT_PAGE_SIZE)
+        if not decisions:
+            return
+
+        await attach_options(decisions)
+        lines = []
+        for decision in decisions:
+            line = {field: decision.get(field) for field in DECISION_EXPORT_FIELDS}
+            line["options"] = [
+                {field: option.get(field) for field in OPTION_EXPORT_FIELDS}
+                for option in decision["options"]
+            ]
+            lines.append(json.dumps(line, default=str))
+        yield ("\n".join(lines) + "\n").encode()
+
+        if cursor is None:
+            return
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a byte stream into numbered lines without buffering the whole body"""
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line
+        if len(buffer) > MAX_IMPORT_LINE_BYTES:
+            raise ValueError(f"Line {line_number + 1} exceeds {MAX_IMPORT_LINE_BYTES} bytes")
+    if buffer:
+        yield line_number + 1, buffer
+
+
+async def _write_batch(user_id: str, batch: list[DecisionImport]) -> tuple[int, int]:
+    """Insert a batch of decisions and their options atomically, in one statement"""
+    response = await supabase.rpc("import_owned_decisions", {
+        "p_owner_id": user_id,
+        "p_decisions": [item.model_dump(mode="json") for item in batch],
+    }).execute()
+    counts = response.data[0]
+    return counts["decisions_imported"], counts["options_imported"]
+
+
+async def import_decisions(user_id: str, chunks: AsyncIterator[bytes]) -> dict:
+    """Read NDJSON decisions from a byte stream and insert them in fixed-size batches.
+
+    Each batch is all-or-nothing. If one fails the import stops there and the summary
+    reports what was stored, with `stopped_at_line` set to the failed batch's first
+    line, so a retry can resume from that line without duplicating earlier batches.
+    """
+    allow_repeated_queries()
+    summary = {"decisions_imported": 0, "options_imported": 0, "errors": [], "stopped_at_line": None}
+    batch: list[DecisionImport] = []
+    batch_start = 0
+
+    async def flush() -> bool:
+        try:
+            decisions, options = await _write_batch(user_id, batch)
+        except Exception as e:
+            summary["stopped_at_line"] = batch_start
+            summary["errors"].append({"line": batch_start, "error": f"Batch not imported: {e}"})
+            return False
+        summary["decisions_imported"] += decisions
+        summary["options_imported"] += options
+        batch.clear()
+        return True
+
+    async for line_number, line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            item = DecisionImport.model_validate_json(line)
+        except ValidationError as e:
+            if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                summary["errors"].append({"line": line_number, "error": str(e)})
+            continue
+        if not batch:
+            batch_start = line_number
+        batch.append(item)
+        if len(batch) >= IMPORT_BATCH_SIZE and not await flush():
+            return summary
+
+    if batch:
+        await flush()
+    return summary
\ No newline at end of file
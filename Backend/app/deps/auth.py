@@ -11,10 +11,10 @@ class CurrentUser(BaseModel):
     id: str
 
 
-def get_current_user(
+async def get_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> str:
-    """Extract and verify current user from JWT token"""
+) -> dict:
+    """Verify the bearer token and return its claims"""
     token = credentials.credentials
     payload = verify_jwt(token)
 
@@ -23,7 +23,14 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
-    
+
+    return payload
+
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+) -> str:
+    """Extract and verify current user from JWT token"""
     # Supabase tokens use 'sub' for the user ID
     user_id = payload.get("sub")
     
@@ -1,21 +1,17 @@
 from fastapi import Depends, HTTPException, status
-from app.db.supabase import supabase
-from app.deps.auth import get_current_user
+from app.core.roles import resolve_role
+from app.deps.auth import get_current_user, get_token_payload
 
 
-async def get_current_admin(user_id: str = Depends(get_current_user)):
+async def get_current_admin(
+    user_id: str = Depends(get_current_user),
+    payload: dict = Depends(get_token_payload),
+):
     """Dependency to check if user is admin"""
     try:
-        response = (
-            supabase
-            .table("users")
-            .select("role")
-            .eq("id", user_id)
-            .single()
-            .execute()
-        )
+        role = await resolve_role(user_id, payload)
 
-        if not response.data or response.data["role"] != "admin":
+        if role != "admin":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admin access required",
@@ -31,25 +27,21 @@ async def get_current_admin(user_id: str = Depends(get_current_user)):
         )
 
 
-async def get_user_role(user_id: str = Depends(get_current_user)):
+async def get_user_role(
+    user_id: str = Depends(get_current_user),
+    payload: dict = Depends(get_token_payload),
+):
     """Get the role of the current user"""
     try:
-        response = (
-            supabase
-            .table("users")
-            .select("role")
-            .eq("id", user_id)
-            .single()
-            .execute()
-        )
+        role = await resolve_role(user_id, payload)
 
-        if not response.data:
+        if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
 
-        return response.data["role"]
+        return role
     except HTTPException:
         raise
     except Exception as e:
@@ -1,8 +1,47 @@
-from fastapi import FastAPI
+# Imported first so the startup report's clock covers every import below
+from app.core.startup import startup
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.config import log_config_warnings
+from app.core.events import change_feed, close_on_shutdown_signal
+from app.core.jwks import jwks_store
+from app.core.logging import RequestIdMiddleware, configure_logging, shutdown_logging
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+from app.core.ratelimit import RateLimitMiddleware
+from app.db.option_writes import option_writes
+from app.db.tracing import DBTracingMiddleware
+from app.db.supabase import connect_supabase, close_supabase, warm_connections
 from app.routers import decisions, options, auth, admin
 
-app = FastAPI(title="Decision Analyzer API")
+configure_logging()
+log_config_warnings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await connect_supabase()
+    startup.mark("lifespan")
+    # Before serving: RS256/ES256 tokens would otherwise get 401 until the keys load.
+    # Bounded by the JWKS client timeout; a failed fetch is retried in the background.
+    await jwks_store.start()
+    startup.mark("jwks")
+    # Connection warm-up runs after the server starts listening; /ready reports when it is done
+    startup.warm_up({"connections": warm_connections})
+    # Streams end on SIGTERM/SIGINT, before the server starts draining connections
+    close_on_shutdown_signal()
+    yield
+    # Buffered option updates are applied before the client goes away
+    await option_writes.flush_all()
+    change_feed.close()
+    await startup.stop()
+    await jwks_store.stop()
+    await close_supabase()
+    shutdown_logging()
+
+
+app = FastAPI(title="Decision Analyzer API", lifespan=lifespan)
 
 # CORS Configuration
 origins = [
@@ -13,6 +52,8 @@ origins = [
     "http://127.0.0.1:5173",
 ]
 
+# Inside CORS so 429/503 responses still carry the CORS headers the browser needs
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -21,12 +62,30 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+# Added innermost first: tracing reports run inside the request id context
+app.add_middleware(DBTracingMiddleware)
+app.add_middleware(RequestIdMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(decisions.router, prefix="/api/v1")
 app.include_router(options.router, prefix="/api/v1")
 app.include_router(admin.router, prefix="/api/v1")
+startup.mark("imports")
 
 @app.get("/")
-def health_check():
-    return {"status": "ok"}
\ No newline at end of file
+async def health_check():
+    return {"status": "ok"}
+
+
+@app.get("/ready", include_in_schema=False)
+async def readiness_check():
+    """Readiness probe: 503 until the background warm-up has finished"""
+    report = startup.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
\ No newline at end of file
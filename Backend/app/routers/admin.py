@@ -1,6 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
+from app.core.roles import VALID_ROLES, invalidate_role
+from app.db.activity import email_prefix_pattern, fetch_user_activity
+from app.db.decision_cache import invalidate_user_decisions
 from app.db.supabase import supabase
+from app.db.pagination import MAX_PAGE_SIZE, paginate, page_result
+from app.db.stats import fetch_dashboard_stats
 from app.deps.roles import get_current_admin
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -17,12 +24,65 @@ class UserListResponse(BaseModel):
     created_at: str
 
 
-@router.get("/users", response_model=list[UserListResponse])
-def get_all_users(admin_id: str = Depends(get_current_admin)):
-    """Get all users (admin only)"""
+class UserListItem(UserListResponse):
+    decision_count: int = 0
+    option_count: int = 0
+
+
+class UserListPage(BaseModel):
+    items: list[UserListItem]
+    next_cursor: str | None = None
+
+
+@router.get("/users", response_model=UserListPage)
+async def get_all_users(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    role: str | None = None,
+    email_prefix: str | None = Query(None, min_length=1, max_length=254),
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    sort: Literal["created_at", "email"] = "created_at",
+    order: Literal["asc", "desc"] = "desc",
+    admin_id: str = Depends(get_current_admin),
+):
+    """Get a filtered, sorted page of users with their activity counts (admin only)"""
     try:
-        response = supabase.table("users").select("*").execute()
-        return response.data if response.data else []
+        query = supabase.table("users").select("id, email, role, created_at")
+
+        if role is not None:
+            if role not in VALID_ROLES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Role must be 'user' or 'admin'",
+                )
+            query = query.eq("role", role)
+        if email_prefix is not None:
+            pattern = email_prefix_pattern(email_prefix)
+            if pattern is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid email prefix",
+                )
+            query = query.like("email", pattern)
+        if created_after is not None:
+            query = query.gte("created_at", created_after.isoformat())
+        if created_before is not None:
+            query = query.lt("created_at", created_before.isoformat())
+
+        response = await paginate(query, limit, cursor, column=sort, desc=order == "desc").execute()
+        users, next_cursor = page_result(response.data or [], limit, column=sort)
+
+        # One aggregate call for the whole page instead of two counts per user
+        activity = await fetch_user_activity([user["id"] for user in users])
+        for user in users:
+            counts = activity.get(user["id"], {})
+            user["decision_count"] = counts.get("decision_count", 0)
+            user["option_count"] = counts.get("option_count", 0)
+
+        return {"items": users, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -31,27 +91,55 @@ def get_all_users(admin_id: str = Depends(get_current_admin)):
 
 
 @router.patch("/users/{user_id}/role", response_model=UserListResponse)
-def update_user_role(
+async def update_user_role(
     user_id: str,
     data: UserRoleUpdate,
     admin_id: str = Depends(get_current_admin),
 ):
     """Update user role (admin only)"""
     try:
-        if data.role not in ["user", "admin"]:
+        if data.role not in VALID_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Role must be 'user' or 'admin'",
             )
 
-        response = (
+        current = await (
             supabase
             .table("users")
-            .update({"role": data.role})
+            .select("role")
             .eq("id", user_id)
-            .select("*")
             .execute()
         )
+        if not current.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        previous_role = current.data[0]["role"]
+
+        # app_metadata feeds the role claim of new tokens; written first so that if it
+        # fails nothing has changed, and reverted if the users table update fails
+        await supabase.auth.admin.update_user_by_id(
+            user_id, {"app_metadata": {"role": data.role}}
+        )
+        try:
+            response = await (
+                supabase
+                .table("users")
+                .update({"role": data.role})
+                .eq("id", user_id)
+                .execute()
+            )
+        except Exception:
+            await supabase.auth.admin.update_user_by_id(
+                user_id, {"app_metadata": {"role": previous_role}}
+            )
+            raise
+        # Tokens issued before now keep the old claim, but an admin claim is always
+        # checked against the users table: other workers see the change within the
+        # role cache TTL. A promotion takes effect once the user gets a new token.
+        invalidate_role(user_id)
 
         if not response.data:
             raise HTTPException(
@@ -70,13 +158,15 @@ def update_user_role(
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     user_id: str,
     admin_id: str = Depends(get_current_admin),
 ):
     """Delete user and all their data (admin only)"""
     try:
-        supabase.auth.admin.delete_user(user_id)
+        await supabase.auth.admin.delete_user(user_id)
+        invalidate_role(user_id)
+        invalidate_user_decisions(user_id)
     except HTTPException:
         raise
     except Exception as e:
@@ -94,26 +184,10 @@ class DashboardStats(BaseModel):
 
 
 @router.get("/dashboard", response_model=DashboardStats)
-def admin_dashboard(admin_id: str = Depends(get_current_admin)):
+async def admin_dashboard(admin_id: str = Depends(get_current_admin)):
     """Admin dashboard stats (admin only)"""
     try:
-        users_response = supabase.table("users").select("id", count="exact").execute()
-        admins_response = (
-            supabase.table("users").select("id", count="exact").eq("role", "admin").execute()
-        )
-        decisions_response = (
-            supabase.table("decisions").select("id", count="exact").execute()
-        )
-        options_response = (
-            supabase.table("decision_options").select("id", count="exact").execute()
-        )
-
-        return {
-            "total_users": users_response.count or 0,
-            "total_admins": admins_response.count or 0,
-            "total_decisions": decisions_response.count or 0,
-            "total_options": options_response.count or 0,
-        }
+        return await fetch_dashboard_stats()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
-from app.db.supabase import supabase
-from app.deps.auth import get_current_user
+from app.core.roles import resolve_role, role_cache, role_from_claims
+from app.db.supabase import supabase, user_auth
+from app.deps.auth import get_current_user, get_token_payload
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -32,10 +33,10 @@ class UserProfile(BaseModel):
 
 
 @router.post("/register", response_model=AuthResponse)
-def register(data: UserRegister):
+async def register(data: UserRegister):
     """Register a new user"""
     try:
-        response = supabase.auth.sign_up({
+        response = await user_auth.sign_up({
             "email": data.email,
             "password": data.password,
         })
@@ -55,11 +56,12 @@ def register(data: UserRegister):
 
         # Create user record with default 'user' role
         try:
-            supabase.table("users").insert({
+            await supabase.table("users").insert({
                 "id": response.user.id,
                 "email": response.user.email,
                 "role": "user",
             }).execute()
+            role_cache.set(response.user.id, "user")
         except Exception as e:
             # If user creation fails, still return the auth response
             pass
@@ -81,10 +83,10 @@ def register(data: UserRegister):
 
 
 @router.post("/login", response_model=AuthResponse)
-def login(data: UserLogin):
+async def login(data: UserLogin):
     """Login user"""
     try:
-        response = supabase.auth.sign_in_with_password({
+        response = await user_auth.sign_in_with_password({
             "email": data.email,
             "password": data.password,
         })
@@ -95,19 +97,11 @@ def login(data: UserLogin):
                 detail="Invalid credentials",
             )
 
-        # Get user role
+        # Get user role (app_metadata first, then the role cache / users table)
         user_role = "user"
         try:
-            user_data = (
-                supabase
-                .table("users")
-                .select("role")
-                .eq("id", response.user.id)
-                .single()
-                .execute()
-            )
-            if user_data.data:
-                user_role = user_data.data["role"]
+            claims = {"app_metadata": response.user.app_metadata}
+            user_role = await resolve_role(response.user.id, claims) or user_role
         except Exception:
             pass
 
@@ -128,7 +122,7 @@ def login(data: UserLogin):
 
 
 @router.post("/refresh")
-def refresh_token(data: dict):
+async def refresh_token(data: dict):
     """Refresh access token"""
     try:
         refresh_token_value = data.get("refresh_token")
@@ -138,7 +132,7 @@ def refresh_token(data: dict):
                 detail="Refresh token not provided",
             )
         
-        response = supabase.auth.refresh_session(refresh_token_value)
+        response = await user_auth.refresh_session(refresh_token_value)
 
         if not response.session:
             raise HTTPException(
@@ -160,26 +154,19 @@ def refresh_token(data: dict):
 
 
 @router.get("/me", response_model=UserProfile)
-def get_current_user_profile(
+async def get_current_user_profile(
     user_id: str = Depends(get_current_user),
+    payload: dict = Depends(get_token_payload),
 ):
     """Get current user profile"""
     try:
-        response = supabase.auth.admin.get_user(user_id)
+        response = await supabase.auth.admin.get_user_by_id(user_id)
 
-        # Get user role
+        # Get user role (token claim, then app_metadata, then the role cache / users table)
         user_role = "user"
         try:
-            user_data = (
-                supabase
-                .table("users")
-                .select("role")
-                .eq("id", user_id)
-                .single()
-                .execute()
-            )
-            if user_data.data:
-                user_role = user_data.data["role"]
+            claims = payload if role_from_claims(payload) else {"app_metadata": response.user.app_metadata}
+            user_role = await resolve_role(user_id, claims) or user_role
         except Exception:
             pass
 
@@ -197,7 +184,7 @@ def get_current_user_profile(
 
 
 @router.post("/logout")
-def logout(user_id: str = Depends(get_current_user)):
+async def logout(user_id: str = Depends(get_current_user)):
     """Logout user (sign out)"""
     try:
         # Note: Supabase doesn't require explicit server-side logout for stateless JWT tokens
@@ -1,21 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from app.core.events import change_feed, event_stream
+from app.core.etag import compute_etag, decision_version, etag_matches, not_modified, page_etag
+from app.core.serialization import decision_page_serializer, serialized_response
+from app.core.singleflight import coalesced_reads
 from app.db.supabase import supabase
+from app.db.decision_cache import (
+    cached_decision,
+    invalidate_decision,
+    invalidate_user_reads,
+    load_and_cache_decision,
+)
+from app.db.loaders import load_decision_page, load_decision_page_with_options, load_decision_with_options
+from app.db.pagination import MAX_PAGE_SIZE
+from app.db.search import MAX_SEARCH_OFFSET, search_decisions
+from app.db.summary import fetch_decision_summaries, summarize_totals
+from app.db.transfer import export_decisions, import_decisions
 from app.deps.auth import get_current_user
-from app.schemas.decision import DecisionCreate, DecisionUpdate, DecisionWithOptions
+from app.schemas.decision import (
+    DecisionCreate,
+    DecisionOut,
+    DecisionPage,
+    DecisionSearchPage,
+    DecisionSummaryResponse,
+    DecisionUpdate,
+    DecisionWithOptions,
+)
 
 router = APIRouter(prefix="/decisions", tags=["decisions"])
+logger = logging.getLogger(__name__)
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
-def create_decision(
+@router.post("/", response_model=DecisionOut, status_code=status.HTTP_201_CREATED)
+async def create_decision(
     data: DecisionCreate,
     user_id: str = Depends(get_current_user),
 ):
     """Create a new decision"""
     try:
-        print(f"[DECISION] Creating decision for user: {user_id}")
-        print(f"[DECISION] Decision data: {data.dict()}")
-        
         # Validate user_id is not empty
         if not user_id:
             raise HTTPException(
@@ -23,7 +47,7 @@ def create_decision(
                 detail="User identification missing",
             )
         
-        response = (
+        response = await (
             supabase
             .table("decisions")
             .insert({
@@ -36,55 +60,82 @@ def create_decision(
         )
 
         if not response.data:
-            print(f"[DECISION] No data returned from insert: {response}")
+            logger.warning("No data returned from decision insert", extra={"user_id": user_id})
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to create decision",
             )
 
-        print(f"[DECISION] Successfully created decision: {response.data[0]}")
+        invalidate_user_reads(user_id)
+        change_feed.publish(user_id, "decision.created", {"decision": response.data[0]})
+        logger.info(
+            "Decision created",
+            extra={"user_id": user_id, "decision_id": response.data[0]["id"]},
+        )
         return response.data[0]
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[DECISION] Decision creation error: {str(e)}")
-        print(f"[DECISION] Exception type: {type(e).__name__}")
+        logger.warning(
+            "Decision creation failed: %s",
+            e,
+            extra={"user_id": user_id, "error_type": type(e).__name__},
+        )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to create decision: {str(e)}",
         )
 
 
-@router.get("/")
-def get_my_decisions(
+@router.get("/", response_model=DecisionPage)
+async def get_my_decisions(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     user_id: str = Depends(get_current_user),
 ):
-    """Get all decisions for the current user with options"""
+    """Get a page of the current user's decisions with options, newest first"""
     try:
-        response = (
-            supabase
-            .table("decisions")
-            .select("*")
-            .eq("owner_id", user_id)
-            .order("created_at", desc=True)
-            .execute()
+        if request.headers.get("if-none-match"):
+            # Cheap probe: only ids and timestamps of the page and its options
+            versions = await coalesced_reads.do(
+                ("decision_page_versions", user_id, limit, cursor),
+                load_decision_page,
+                user_id, limit, cursor, "id, created_at, updated_at, decision_options(id, updated_at)",
+            )
+            etag = page_etag(*versions)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+
+        # Decisions plus one batched options query, shared with identical concurrent requests
+        decisions, next_cursor = await coalesced_reads.do(
+            ("decision_page", user_id, limit, cursor),
+            load_decision_page_with_options,
+            user_id, limit, cursor,
+        )
+        # Pre-compiled serializer: rows go straight to JSON bytes without validation
+        return serialized_response(
+            decision_page_serializer,
+            {"items": decisions, "next_cursor": next_cursor},
+            headers={"ETag": page_etag(decisions, next_cursor)},
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-        decisions = response.data if response.data else []
-        
-        # Fetch options for each decision
-        for decision in decisions:
-            options_response = (
-                supabase
-                .table("decision_options")
-                .select("*")
-                .eq("decision_id", decision["id"])
-                .order("created_at", desc=False)
-                .execute()
-            )
-            decision["options"] = options_response.data if options_response.data else []
 
-        return decisions
+@router.get("/summary", response_model=DecisionSummaryResponse)
+async def get_decision_summary(
+    user_id: str = Depends(get_current_user),
+):
+    """Rating aggregates per decision and overall, without transferring options"""
+    try:
+        summaries = await fetch_decision_summaries(user_id)
+        return {"totals": summarize_totals(summaries), "decisions": summaries}
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -92,44 +143,103 @@ def get_my_decisions(
         )
 
 
-@router.get("/{decision_id}")
-def get_decision_with_options(
+@router.get("/search", response_model=DecisionSearchPage)
+async def search_my_decisions(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    user_id: str = Depends(get_current_user),
+):
+    """Full-text search over decision titles, descriptions and option texts, best match first"""
+    try:
+        items, next_offset = await search_decisions(user_id, q, limit, offset)
+        return {"items": items, "next_offset": next_offset}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/export")
+async def export_my_decisions(
+    user_id: str = Depends(get_current_user),
+):
+    """Stream all of the current user's decisions and options as NDJSON"""
+    return StreamingResponse(
+        export_decisions(user_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="decisions.ndjson"'},
+    )
+
+
+@router.get("/stream")
+async def stream_my_changes(
+    user_id: str = Depends(get_current_user),
+):
+    """Server-Sent Events feed of the current user's decision and option changes"""
+    return StreamingResponse(
+        event_stream(user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/import", status_code=status.HTTP_201_CREATED)
+async def import_my_decisions(
+    request: Request,
+    user_id: str = Depends(get_current_user),
+):
+    """Import decisions from an NDJSON body (the export format), in fixed-size batches"""
+    try:
+        summary = await import_decisions(user_id, request.stream())
+        # Too many rows to stream as deltas; subscribers refetch instead
+        change_feed.publish(user_id, "decisions.imported", summary)
+        return summary
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Import failed: {str(e)}",
+        )
+    finally:
+        # Batches may have landed even if a later one failed
+        invalidate_user_reads(user_id)
+
+
+@router.get("/{decision_id}", response_model=DecisionWithOptions)
+async def get_decision_with_options(
     decision_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user),
 ):
     """Get a single decision with all its options"""
     try:
-        # Get decision
-        decision_response = (
-            supabase
-            .table("decisions")
-            .select("*")
-            .eq("id", decision_id)
-            .eq("owner_id", user_id)
-            .single()
-            .execute()
-        )
+        decision = cached_decision(decision_id, user_id)
+        if decision is None:
+            if request.headers.get("if-none-match"):
+                # Revalidate against versions only, without loading option bodies
+                versions = await load_decision_with_options(
+                    decision_id, user_id, columns="id, updated_at", option_columns="id, updated_at"
+                )
+                if versions:
+                    etag = compute_etag(decision_version(versions))
+                    if etag_matches(request, etag):
+                        return not_modified(etag)
+
+            # Decision and options in one round trip, cached until the next write
+            decision = await load_and_cache_decision(decision_id, user_id)
 
-        if not decision_response.data:
+        if not decision:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Decision not found",
             )
 
-        decision = decision_response.data
-
-        # Get options
-        options_response = (
-            supabase
-            .table("decision_options")
-            .select("*")
-            .eq("decision_id", decision_id)
-            .order("created_at", desc=False)
-            .execute()
-        )
-
-        decision["options"] = options_response.data if options_response.data else []
-
+        etag = compute_etag(decision_version(decision))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
         return decision
     except HTTPException:
         raise
@@ -140,8 +250,8 @@ def get_decision_with_options(
         )
 
 
-@router.patch("/{decision_id}")
-def update_decision(
+@router.patch("/{decision_id}", response_model=DecisionOut)
+async def update_decision(
     decision_id: str,
     data: DecisionUpdate,
     user_id: str = Depends(get_current_user),
@@ -149,10 +259,10 @@ def update_decision(
     """Update a decision"""
     try:
         # Ownership check
-        check = (
+        check = await (
             supabase
             .table("decisions")
-            .select("id")
+            .select("*")
             .eq("id", decision_id)
             .eq("owner_id", user_id)
             .execute()
@@ -172,22 +282,26 @@ def update_decision(
         if not update_data:
             return check.data[0]
 
-        updated = (
+        # Bump the version that ETags are derived from
+        update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+
+        updated = await (
             supabase
             .table("decisions")
             .update(update_data)
             .eq("id", decision_id)
             .eq("owner_id", user_id)
-            .select("*")
             .execute()
         )
 
+        invalidate_decision(user_id, decision_id)
         if not updated.data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to update decision",
             )
 
+        change_feed.publish(user_id, "decision.updated", {"decision": updated.data[0]})
         return updated.data[0]
     except HTTPException:
         raise
@@ -199,13 +313,13 @@ def update_decision(
 
 
 @router.delete("/{decision_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_decision(
+async def delete_decision(
     decision_id: str,
     user_id: str = Depends(get_current_user),
 ):
     """Delete a decision (cascades to delete all options)"""
     try:
-        response = (
+        response = await (
             supabase
             .table("decisions")
             .delete()
@@ -213,12 +327,14 @@ def delete_decision(
             .eq("owner_id", user_id)
             .execute()
         )
+        invalidate_decision(user_id, decision_id)
 
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Decision not found",
             )
+        change_feed.publish(user_id, "decision.deleted", {"decision_id": response.data[0]["id"]})
     except HTTPException:
         raise
     except Exception as e:
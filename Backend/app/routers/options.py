@@ -1,35 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from app.core.etag import compute_etag, etag_matches, not_modified, option_versions
+from app.core.events import publish_options
+from app.core.serialization import option_list_serializer, serialized_response
+from app.core.singleflight import coalesced_reads
 from app.db.supabase import supabase
+from app.db.decision_cache import cached_decision, invalidate_decision
+from app.db.loaders import load_decision_with_options
+from app.db.option_writes import option_writes
 from app.deps.auth import get_current_user
-from app.schemas.options import OptionCreate, OptionUpdate
+from app.schemas.options import (
+    OptionBulkCreate,
+    OptionBulkDelete,
+    OptionBulkResult,
+    OptionBulkUpdate,
+    OptionCreate,
+    OptionResponse,
+    OptionUpdate,
+)
 
 router = APIRouter(prefix="/options", tags=["options"])
+logger = logging.getLogger(__name__)
 
+# Each mutation is a single SQL function call that joins decision_options to
+# decisions on owner_id, so the ownership check and the write happen in one
+# statement (see SUPABASE_SCHEMA.sql). No row back means "not found or not yours".
+# Every mutation also drops the parent decision from the decision cache and
+# publishes the changed rows on the user's change feed.
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
-def add_option(
+
+@router.post("/", response_model=OptionResponse, status_code=status.HTTP_201_CREATED)
+async def add_option(
     data: OptionCreate,
     user_id: str = Depends(get_current_user),
 ):
     """Add a new option to a decision"""
     try:
-        # Ensure decision belongs to current user
-        decision_response = (
-            supabase
-            .table("decisions")
-            .select("id")
-            .eq("id", str(data.decision_id))
-            .eq("owner_id", user_id)
-            .single()
-            .execute()
-        )
-
-        if not decision_response.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Decision not found",
-            )
-
         # Validate rating if provided
         if data.rating is not None and (data.rating < 1 or data.rating > 5):
             raise HTTPException(
@@ -37,157 +43,251 @@ def add_option(
                 detail="Rating must be between 1 and 5",
             )
 
-        # Insert option
-        option_response = (
-            supabase
-            .table("decision_options")
-            .insert({
-                "decision_id": str(data.decision_id),
-                "option_text": data.option_text,
-                "rating": data.rating,
-            })
-            .execute()
-        )
+        # Insert option only if the decision belongs to current user
+        option_response = await supabase.rpc("add_owned_option", {
+            "p_owner_id": user_id,
+            "p_decision_id": str(data.decision_id),
+            "p_option_text": data.option_text,
+            "p_rating": data.rating,
+        }).execute()
+        invalidate_decision(user_id, str(data.decision_id))
 
         if not option_response.data:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to create option",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Decision not found",
             )
 
+        publish_options(user_id, "option.created", option_response.data)
         return option_response.data[0]
     except HTTPException:
         raise
     except Exception as e:
+        logger.warning("add_option failed: %s", e, extra={"user_id": user_id})
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
 
-@router.get("/{decision_id}")
-def get_options(
-    decision_id: str,
+def _item_result(index: int, option_id: str, rows: dict, done_status: str) -> dict:
+    if option_id not in rows:
+        return {"index": index, "id": option_id, "status": "not_found"}
+    return {"index": index, "id": option_id, "status": done_status, "option": rows[option_id]}
+
+
+@router.post("/bulk", response_model=OptionBulkResult, status_code=status.HTTP_201_CREATED)
+async def add_options_bulk(
+    data: OptionBulkCreate,
     user_id: str = Depends(get_current_user),
 ):
-    """Get all options for a decision"""
+    """Add many options to one decision in a single statement"""
     try:
-        # Ownership check
-        decision_response = (
-            supabase
-            .table("decisions")
-            .select("id")
-            .eq("id", decision_id)
-            .eq("owner_id", user_id)
-            .single()
-            .execute()
-        )
-
-        if not decision_response.data:
+        created_res = await supabase.rpc("add_owned_options", {
+            "p_owner_id": user_id,
+            "p_decision_id": str(data.decision_id),
+            "p_options": [item.model_dump() for item in data.options],
+        }).execute()
+        invalidate_decision(user_id, str(data.decision_id))
+
+        if not created_res.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Decision not found",
             )
 
-        # Fetch options
-        options_response = (
-            supabase
-            .table("decision_options")
-            .select("*")
-            .eq("decision_id", decision_id)
-            .order("created_at", desc=False)
-            .execute()
+        publish_options(user_id, "option.created", created_res.data)
+        # Rows come back in input order
+        return {
+            "decision_id": data.decision_id,
+            "results": [
+                {"index": index, "id": option["id"], "status": "created", "option": option}
+                for index, option in enumerate(created_res.data)
+            ],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning("add_options_bulk failed: %s", e, extra={"user_id": user_id})
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-        return options_response.data
+
+@router.patch("/bulk", response_model=OptionBulkResult)
+async def update_options_bulk(
+    data: OptionBulkUpdate,
+    user_id: str = Depends(get_current_user),
+):
+    """Update many options of one decision in a single statement"""
+    try:
+        # Repeated ids collapse to the last update, matching sequential PATCHes
+        updates = {}
+        for item in data.updates:
+            updates[str(item.id)] = item.model_dump(mode="json")
+
+        updated_res = await supabase.rpc("update_owned_options", {
+            "p_owner_id": user_id,
+            "p_decision_id": str(data.decision_id),
+            "p_updates": list(updates.values()),
+        }).execute()
+        invalidate_decision(user_id, str(data.decision_id))
+
+        publish_options(user_id, "option.updated", updated_res.data or [])
+        updated = {option["id"]: option for option in updated_res.data or []}
+        return {
+            "decision_id": data.decision_id,
+            "results": [
+                _item_result(index, str(item.id), updated, "updated")
+                for index, item in enumerate(data.updates)
+            ],
+        }
     except HTTPException:
         raise
     except Exception as e:
+        logger.warning("update_options_bulk failed: %s", e, extra={"user_id": user_id})
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
 
-@router.patch("/{option_id}")
-def update_option(
-    option_id: str,
-    data: OptionUpdate,
+@router.post("/bulk-delete", response_model=OptionBulkResult)
+async def delete_options_bulk(
+    data: OptionBulkDelete,
     user_id: str = Depends(get_current_user),
 ):
-    """Update an option"""
+    """Delete many options of one decision in a single statement"""
     try:
-        # 1️⃣ Find option and its decision
-        option_res = (
-            supabase
-            .table("decision_options")
-            .select("id, decision_id")
-            .eq("id", option_id)
-            .single()
-            .execute()
+        option_ids = [str(option_id) for option_id in data.option_ids]
+        deleted_res = await supabase.rpc("delete_owned_options", {
+            "p_owner_id": user_id,
+            "p_decision_id": str(data.decision_id),
+            "p_option_ids": option_ids,
+        }).execute()
+        invalidate_decision(user_id, str(data.decision_id))
+
+        publish_options(user_id, "option.deleted", deleted_res.data or [])
+        deleted = {option["id"]: None for option in deleted_res.data or []}
+        return {
+            "decision_id": data.decision_id,
+            "results": [
+                _item_result(index, option_id, deleted, "deleted")
+                for index, option_id in enumerate(option_ids)
+            ],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning("delete_options_bulk failed: %s", e, extra={"user_id": user_id})
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-        if not option_res.data:
+
+@router.get("/{decision_id}", response_model=list[OptionResponse])
+async def get_options(
+    decision_id: str,
+    request: Request,
+    user_id: str = Depends(get_current_user),
+):
+    """Get all options for a decision"""
+    try:
+        decision = cached_decision(decision_id, user_id)
+        if decision is not None:
+            etag = compute_etag(option_versions(decision["options"]))
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            return serialized_response(
+                option_list_serializer, decision["options"], headers={"ETag": etag}
+            )
+
+        if request.headers.get("if-none-match"):
+            # Revalidate against option versions only
+            versions = await load_decision_with_options(
+                decision_id, user_id, columns="id", option_columns="id, updated_at"
+            )
+            if versions:
+                etag = compute_etag(option_versions(versions["options"]))
+                if etag_matches(request, etag):
+                    return not_modified(etag)
+
+        # Ownership check and options fetch in one query, shared with identical concurrent requests
+        decision = await coalesced_reads.do(
+            ("decision_options", user_id, decision_id),
+            load_decision_with_options,
+            decision_id, user_id, "id",
+        )
+
+        if not decision:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Option not found",
+                detail="Decision not found",
             )
 
-        decision_id = option_res.data["decision_id"]
-
-        # 2️⃣ Ensure decision belongs to current user
-        decision_res = (
-            supabase
-            .table("decisions")
-            .select("id")
-            .eq("id", decision_id)
-            .eq("owner_id", user_id)
-            .single()
-            .execute()
+        return serialized_response(
+            option_list_serializer,
+            decision["options"],
+            headers={"ETag": compute_etag(option_versions(decision["options"]))},
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning("get_options failed: %s", e, extra={"user_id": user_id})
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-        if not decision_res.data:
+
+@router.patch("/{option_id}", response_model=OptionResponse)
+async def update_option(
+    option_id: str,
+    data: OptionUpdate,
+    user_id: str = Depends(get_current_user),
+):
+    """Update an option"""
+    try:
+        if data.rating is not None and (data.rating < 1 or data.rating > 5):
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to update this option",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Rating must be between 1 and 5",
             )
 
-        # 3️⃣ Prepare update data
-        update_data = {}
-        if data.option_text is not None:
-            update_data["option_text"] = data.option_text
-        if data.rating is not None:
-            if data.rating < 1 or data.rating > 5:
+        if option_writes.enabled:
+            # Merged with other updates from this user arriving within the coalescing window
+            changes = data.model_dump(exclude_none=True)
+            updated = await option_writes.update(user_id, option_id, changes)
+            if updated is None:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Rating must be between 1 and 5",
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Option not found",
                 )
-            update_data["rating"] = data.rating
-
-        if not update_data:
-            # Return existing option if nothing to update
-            return option_res.data[0]
-
-        # 4️⃣ Update option
-        updated_res = (
-            supabase
-            .table("decision_options")
-            .update(update_data)
-            .eq("id", option_id)
-            .select("*")
-            .execute()
-        )
+            return updated
+
+        # Unset fields are left unchanged; with nothing to change the current row comes back
+        updated_res = await supabase.rpc("update_owned_option", {
+            "p_owner_id": user_id,
+            "p_option_id": option_id,
+            "p_option_text": data.option_text,
+            "p_rating": data.rating,
+        }).execute()
 
         if not updated_res.data:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to update option",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Option not found",
             )
+        invalidate_decision(user_id, updated_res.data[0]["decision_id"])
+        publish_options(user_id, "option.updated", updated_res.data)
 
         return updated_res.data[0]
     except HTTPException:
         raise
     except Exception as e:
+        logger.warning("update_option failed: %s", e, extra={"user_id": user_id})
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -195,64 +295,28 @@ def update_option(
 
 
 @router.delete("/{option_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_option(
+async def delete_option(
     option_id: str,
     user_id: str = Depends(get_current_user),
 ):
     """Delete an option"""
     try:
-        # 1️⃣ Find option and its decision
-        option_res = (
-            supabase
-            .table("decision_options")
-            .select("id, decision_id")
-            .eq("id", option_id)
-            .single()
-            .execute()
-        )
-
-        if not option_res.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Option not found",
-            )
-
-        decision_id = option_res.data["decision_id"]
-
-        # 2️⃣ Ensure decision belongs to current user
-        decision_res = (
-            supabase
-            .table("decisions")
-            .select("id")
-            .eq("id", decision_id)
-            .eq("owner_id", user_id)
-            .single()
-            .execute()
-        )
-
-        if not decision_res.data:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to delete this option",
-            )
-
-        # 3️⃣ Delete option
-        delete_res = (
-            supabase
-            .table("decision_options")
-            .delete()
-            .eq("id", option_id)
-            .execute()
-        )
+        delete_res = await supabase.rpc("delete_owned_option", {
+            "p_owner_id": user_id,
+            "p_option_id": option_id,
+        }).execute()
 
         if not delete_res.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Option not found",
             )
+        invalidate_decision(user_id, delete_res.data[0]["decision_id"])
+        publish_options(user_id, "option.deleted", delete_res.data)
     except HTTPException:
         raise
     except Exception as e:
+        logger.warning("delete_option failed: %s", e, extra={"user_id": user_id})
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
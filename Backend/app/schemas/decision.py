@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
+from app.schemas.options import OptionImport, OptionRecord, OptionResponse
 
 class DecisionCreate(BaseModel):
     title: str
@@ -16,9 +18,76 @@ class DecisionOut(BaseModel):
     title: str
     description: Optional[str]
     owner_id: UUID
-    is_active: bool
+    is_active: Optional[bool]
     created_at: datetime
     updated_at: datetime
 
 class DecisionWithOptions(DecisionOut):
-    options: list = []
\ No newline at end of file
+    options: list[OptionResponse] = []
+
+class DecisionPage(BaseModel):
+    items: list[DecisionWithOptions]
+    next_cursor: Optional[str] = None
+
+class DecisionRecord(TypedDict):
+    """DecisionWithOptions as the raw PostgREST row, for serializing without validation"""
+    id: str
+    title: str
+    description: Optional[str]
+    owner_id: str
+    is_active: Optional[bool]
+    created_at: str
+    updated_at: str
+    options: list[OptionRecord]
+
+class DecisionPageRecord(TypedDict):
+    items: list[DecisionRecord]
+    next_cursor: Optional[str]
+
+class DecisionImport(BaseModel):
+    """One line of an NDJSON decision export; ids are regenerated, timestamps kept"""
+    title: str
+    description: Optional[str] = None
+    is_active: bool = True
+    created_at: Optional[datetime] = None
+    options: list[OptionImport] = Field(default_factory=list, max_length=1000)
+
+class DecisionSummary(BaseModel):
+    """Rating aggregates of one decision; ratings are 1-5 and unrated options are excluded"""
+    decision_id: UUID
+    title: str
+    is_active: Optional[bool] = None
+    option_count: int
+    unrated_count: int
+    mean_rating: Optional[float] = None
+    median_rating: Optional[float] = None
+    top_option_id: Optional[UUID] = None
+    top_option_text: Optional[str] = None
+    top_rating: Optional[int] = None
+    rating_counts: list[int]
+
+class DecisionSummaryTotals(BaseModel):
+    decisions: int
+    options: int
+    unrated: int
+    mean_rating: Optional[float] = None
+    median_rating: Optional[float] = None
+    rating_counts: list[int]
+
+class DecisionSummaryResponse(BaseModel):
+    totals: DecisionSummaryTotals
+    decisions: list[DecisionSummary]
+
+class DecisionSearchResult(BaseModel):
+    id: UUID
+    title: str
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+    created_at: datetime
+    updated_at: datetime
+    rank: float
+    matched_options: list[str] = []
+
+class DecisionSearchPage(BaseModel):
+    items: list[DecisionSearchResult]
+    next_offset: Optional[int] = None
\ No newline at end of file
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 from uuid import UUID
 from typing import Optional
 from datetime import datetime
@@ -18,4 +19,49 @@ class OptionResponse(BaseModel):
     option_text: str
     rating: Optional[int]
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+class OptionRecord(TypedDict):
+    """OptionResponse as the raw PostgREST row, for serializing without validation"""
+    id: str
+    decision_id: str
+    option_text: str
+    rating: Optional[int]
+    created_at: str
+    updated_at: str
+
+# Bulk operations (one decision per request)
+MAX_BULK_OPTIONS = 100
+
+class OptionBulkItem(BaseModel):
+    option_text: str
+    rating: Optional[int] = Field(None, ge=1, le=5)
+
+class OptionImport(OptionBulkItem):
+    """An option on an NDJSON import line; its exported id is not kept, rows get new ids"""
+    created_at: Optional[datetime] = None
+
+class OptionBulkCreate(BaseModel):
+    decision_id: UUID
+    options: list[OptionBulkItem] = Field(..., min_length=1, max_length=MAX_BULK_OPTIONS)
+
+class OptionBulkUpdateItem(OptionUpdate):
+    id: UUID
+
+class OptionBulkUpdate(BaseModel):
+    decision_id: UUID
+    updates: list[OptionBulkUpdateItem] = Field(..., min_length=1, max_length=MAX_BULK_OPTIONS)
+
+class OptionBulkDelete(BaseModel):
+    decision_id: UUID
+    option_ids: list[UUID] = Field(..., min_length=1, max_length=MAX_BULK_OPTIONS)
+
+class OptionBulkItemResult(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    status: str  # 'created', 'updated', 'deleted' or 'not_found'
+    option: Optional[OptionResponse] = None
+
+class OptionBulkResult(BaseModel):
+    decision_id: UUID
+    results: list[OptionBulkItemResult]
\ No newline at end of file
@@ -0,0 +1,654 @@
+"""In-memory Supabase stand-in (PostgREST, RPC functions, GoTrue) for benchmarks.
+
+Serve it to the app with `connect_supabase(transport=FakeSupabase().transport())`.
+"""
+import asyncio
+import functools
+import json
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl
+
+import httpx
+import jwt
+
+# Child -> parent foreign keys used to resolve embedded selects
+FOREIGN_KEYS = {
+    ("decision_options", "decisions"): "decision_id",
+    ("decisions", "users"): "owner_id",
+}
+
+# Columns kept in hash indexes so point lookups, `in` filters and embeds skip table scans
+INDEXED_COLUMNS = {
+    "users": ("id",),
+    "decisions": ("id", "owner_id"),
+    "decision_options": ("id", "decision_id"),
+}
+
+TABLE_DEFAULTS = {
+    "users": {"role": "user"},
+    "decisions": {"is_active": True, "description": None},
+    "decision_options": {"rating": None},
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _split_top(text: str, sep: str = ",") -> list[str]:
+    """Split on `sep` outside parentheses and double quotes"""
+    parts, depth, quoted, current = [], 0, False, []
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == sep and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) >= 2 and value[0] == value[-1] == '"' else value
+
+
+def _coerce(left, right: str):
+    if isinstance(left, bool):
+        return right == "true"
+    if isinstance(left, int):
+        return int(right)
+    if isinstance(left, float):
+        return float(right)
+    if isinstance(left, str) and re.match(r"^\d{4}-\d{2}-\d{2}", left):
+        try:
+            return datetime.fromisoformat(right).isoformat()
+        except ValueError:
+            return right
+    return right
+
+
+@functools.lru_cache(maxsize=256)
+def _in_values(raw: str) -> frozenset:
+    return frozenset(_unquote(v) for v in _split_top(raw.strip("()")))
+
+
+def _like(pattern: str, value: str, flags=0) -> bool:
+    # `*` / `%` match any run, `_` one character, and a backslash escapes the next character
+    regex, chars = ["^"], iter(pattern)
+    for ch in chars:
+        if ch == "\\":
+            regex.append(re.escape(next(chars, "\\")))
+        elif ch in "*%":
+            regex.append(".*")
+        elif ch == "_":
+            regex.append(".")
+        else:
+            regex.append(re.escape(ch))
+    return re.match("".join(regex) + "$", value, flags) is not None
+
+
+def _compare(row: dict, column: str, expr: str) -> bool:
+    negate = expr.startswith("not.")
+    if negate:
+        expr = expr[4:]
+    op, _, raw = expr.partition(".")
+    value = row.get(column)
+    if op == "is":
+        result = value is None if raw == "null" else value is (raw == "true")
+    elif op == "in":
+        result = value is not None and str(value) in _in_values(raw)
+    elif value is None:
+        result = False
+    else:
+        target = _coerce(value, _unquote(raw))
+        if isinstance(value, str) and re.match(r"^\d{4}-\d{2}-\d{2}", value):
+            value = datetime.fromisoformat(value).isoformat()
+        if op == "eq":
+            result = value == target
+        elif op == "neq":
+            result = value != target
+        elif op == "lt":
+            result = value < target
+        elif op == "lte":
+            result = value <= target
+        elif op == "gt":
+            result = value > target
+        elif op == "gte":
+            result = value >= target
+        elif op == "like":
+            result = _like(target, str(value))
+        elif op == "ilike":
+            result = _like(target, str(value), re.I)
+        else:
+            raise ValueError(f"unsupported operator {op}")
+    return not result if negate else result
+
+
+def _logic(row: dict, expr: str, conjunction: str) -> bool:
+    results = []
+    for part in _split_top(expr.strip("()")):
+        if part.startswith(("and(", "or(")):
+            inner, _, rest = part.partition("(")
+            results.append(_logic(row, "(" + rest, inner))
+        else:
+            column, _, condition = part.partition(".")
+            results.append(_compare(row, column, condition))
+    return all(results) if conjunction == "and" else any(results)
+
+
+def _owns_decision(fake, owner_id, decision_id) -> bool:
+    return any(d["owner_id"] == owner_id for d in fake.lookup("decisions", "id", decision_id))
+
+
+def _owned_option(fake, owner_id, option_id):
+    option = next(iter(fake.lookup("decision_options", "id", option_id)), None)
+    if option is None:
+        return None
+    return option if _owns_decision(fake, owner_id, option["decision_id"]) else None
+
+
+def _rpc_add_owned_option(fake, p_owner_id, p_decision_id, p_option_text, p_rating=None):
+    if not _owns_decision(fake, p_owner_id, p_decision_id):
+        return []
+    return [fake.insert("decision_options", {"decision_id": p_decision_id,
+                                             "option_text": p_option_text, "rating": p_rating})]
+
+
+def _rpc_update_owned_option(fake, p_owner_id, p_option_id, p_option_text=None, p_rating=None):
+    option = _owned_option(fake, p_owner_id, p_option_id)
+    if option is None:
+        return []
+    if p_option_text is not None:
+        option["option_text"] = p_option_text
+    if p_rating is not None:
+        option["rating"] = p_rating
+    option["updated_at"] = _now()
+    return [dict(option)]
+
+
+def _rpc_delete_owned_option(fake, p_owner_id, p_option_id):
+    option = _owned_option(fake, p_owner_id, p_option_id)
+    if option is None:
+        return []
+    fake.remove("decision_options", [option])
+    return [option]
+
+
+def _rpc_add_owned_options(fake, p_owner_id, p_decision_id, p_options):
+    if not _owns_decision(fake, p_owner_id, p_decision_id):
+        return []
+    return [fake.insert("decision_options", {"decision_id": p_decision_id,
+                                             "option_text": item["option_text"],
+                                             "rating": item.get("rating")})
+            for item in p_options]
+
+
+def _rpc_import_owned_decisions(fake, p_owner_id, p_decisions):
+    options = 0
+    for item in p_decisions:
+        decision = fake.insert("decisions", {
+            "owner_id": p_owner_id,
+            "title": item["title"],
+            "description": item.get("description"),
+            "is_active": item.get("is_active", True),
+            **({"created_at": item["created_at"]} if item.get("created_at") else {}),
+        })
+        for option in item.get("options") or []:
+            fake.insert("decision_options", {
+                "decision_id": decision["id"],
+                "option_text": option["option_text"],
+                "rating": option.get("rating"),
+                **({"created_at": option["created_at"]} if option.get("created_at") else {}),
+            })
+            options += 1
+    return [{"decisions_imported": len(p_decisions), "options_imported": options}]
+
+
+def _rpc_update_owned_options(fake, p_owner_id, p_decision_id, p_updates):
+    out = []
+    for item in p_updates:
+        option = _owned_option(fake, p_owner_id, item["id"])
+        if option is None or p_decision_id not in (None, option["decision_id"]):
+            continue
+        out += _rpc_update_owned_option(fake, p_owner_id, item["id"],
+                                        item.get("option_text"), item.get("rating"))
+    return out
+
+
+def _rpc_delete_owned_options(fake, p_owner_id, p_decision_id, p_option_ids):
+    out = []
+    for option_id in p_option_ids:
+        option = _owned_option(fake, p_owner_id, option_id)
+        if option is not None and option["decision_id"] == p_decision_id:
+            out += _rpc_delete_owned_option(fake, p_owner_id, option_id)
+    return out
+
+
+def _rpc_decision_rating_summaries(fake, p_owner_id):
+    decisions = sorted(fake.lookup("decisions", "owner_id", p_owner_id),
+                       key=lambda d: (d["created_at"], d["id"]), reverse=True)
+    out = []
+    for decision in decisions:
+        options = fake.lookup("decision_options", "decision_id", decision["id"])
+        rated = sorted((o for o in options if o.get("rating") is not None),
+                       key=lambda o: (-o["rating"], o["created_at"], o["id"]))
+        ratings = sorted(o["rating"] for o in rated)
+        middle = (ratings[(len(ratings) - 1) // 2] + ratings[len(ratings) // 2]) / 2 if ratings else None
+        out.append({
+            "decision_id": decision["id"],
+            "title": decision["title"],
+            "is_active": decision.get("is_active"),
+            "option_count": len(options),
+            "unrated_count": len(options) - len(rated),
+            "mean_rating": round(sum(ratings) / len(ratings), 2) if ratings else None,
+            "median_rating": middle,
+            "top_option_id": rated[0]["id"] if rated else None,
+            "top_option_text": rated[0]["option_text"] if rated else None,
+            "top_rating": rated[0]["rating"] if rated else None,
+            "rating_counts": [ratings.count(n) for n in range(1, 6)],
+        })
+    return out
+
+
+def _words(text: str | None) -> list[str]:
+    return re.findall(r"[^\W_]+", (text or "").lower())
+
+
+def _text_matches(terms: list[str], text: str | None) -> bool:
+    words = _words(text)
+    return all(any(word.startswith(term) for word in words) for term in terms)
+
+
+def _rpc_search_decisions(fake, p_owner_id, p_query, p_limit=20, p_offset=0):
+    """Prefix AND-matching in place of tsvector ranking: title > description > options"""
+    terms = [term.removesuffix(":*") for term in p_query.split(" & ")]
+    hits = []
+    for decision in fake.lookup("decisions", "owner_id", p_owner_id):
+        rank = 0.0
+        if _text_matches(terms, decision["title"]):
+            rank = 0.6
+        elif _text_matches(terms, f"{decision['title']} {decision.get('description') or ''}"):
+            rank = 0.4
+        options = sorted(fake.lookup("decision_options", "decision_id", decision["id"]),
+                         key=lambda o: o["created_at"])
+        matched = [o["option_text"] for o in options if _text_matches(terms, o["option_text"])]
+        if matched:
+            rank = max(rank, 0.2)
+        if rank:
+            hits.append({**{k: decision.get(k) for k in ("id", "title", "description", "is_active",
+                                                         "created_at", "updated_at")},
+                         "rank": rank, "matched_options": matched})
+    hits.sort(key=lambda h: (h["rank"], h["created_at"], h["id"]), reverse=True)
+    return hits[p_offset:p_offset + p_limit]
+
+
+def _rpc_user_activity_counts(fake, p_user_ids):
+    out = []
+    for user_id in p_user_ids:
+        decisions = fake.lookup("decisions", "owner_id", user_id)
+        if decisions:
+            options = sum(len(fake.lookup("decision_options", "decision_id", d["id"])) for d in decisions)
+            out.append({"user_id": user_id, "decision_count": len(decisions), "option_count": options})
+    return out
+
+
+DEFAULT_RPCS = {
+    "user_activity_counts": _rpc_user_activity_counts,
+    "search_decisions": _rpc_search_decisions,
+    "decision_rating_summaries": _rpc_decision_rating_summaries,
+    "add_owned_options": _rpc_add_owned_options,
+    "import_owned_decisions": _rpc_import_owned_decisions,
+    "update_owned_options": _rpc_update_owned_options,
+    "delete_owned_options": _rpc_delete_owned_options,
+    "add_owned_option": _rpc_add_owned_option,
+    "update_owned_option": _rpc_update_owned_option,
+    "delete_owned_option": _rpc_delete_owned_option,
+}
+
+
+class FakeSupabase:
+    """In-memory PostgREST + GoTrue stand-in served through an httpx transport.
+
+    Implements the subset of the REST, RPC and auth APIs the routers use, with an
+    optional `latency` (seconds) slept before every response to mimic network I/O.
+    With `service_key` set, RPCs called with any other bearer token are refused, as
+    the schema revokes EXECUTE on them from `authenticated`.
+    """
+
+    def __init__(self, url: str = "http://fake.supabase.local", jwt_secret: str = "fake-secret",
+                 latency: float = 0.0, service_key: str | None = None):
+        self.url = url
+        self.jwt_secret = jwt_secret
+        self.latency = latency
+        self.service_key = service_key
+        self.tables: dict[str, list[dict]] = {name: [] for name in TABLE_DEFAULTS}
+        self.indexes: dict[str, dict[str, dict]] = {
+            table: {column: {} for column in columns} for table, columns in INDEXED_COLUMNS.items()
+        }
+        self.passwords: dict[str, tuple[str, str]] = {}
+        self.rpcs: dict[str, callable] = dict(DEFAULT_RPCS)
+        self.request_count = 0
+        self.jwks: list[dict] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def issue_token(self, user_id: str, email: str = "", role: str | None = None,
+                    ttl: int = 3600) -> str:
+        claims = {
+            "sub": user_id,
+            "email": email,
+            "aud": "authenticated",
+            "iss": f"{self.url}/auth/v1",
+            "iat": int(time.time()),
+            "exp": int(time.time()) + ttl,
+            "role": "authenticated",
+        }
+        if role:
+            claims["app_metadata"] = {"role": role}
+        return jwt.encode(claims, self.jwt_secret, algorithm="HS256")
+
+    def add_user(self, email: str, password: str = "password", role: str = "user") -> str:
+        user_id = str(uuid.uuid4())
+        self.passwords[email] = (password, user_id)
+        self.insert("users", {"id": user_id, "email": email, "role": role})
+        return user_id
+
+    def insert(self, table: str, row: dict) -> dict:
+        stamp = _now()
+        full = {"id": str(uuid.uuid4()), "created_at": stamp, "updated_at": stamp,
+                **TABLE_DEFAULTS.get(table, {}), **row}
+        self.tables.setdefault(table, []).append(full)
+        for column, index in self.indexes.get(table, {}).items():
+            index.setdefault(full.get(column), []).append(full)
+        return full
+
+    def lookup(self, table: str, column: str, value) -> list[dict]:
+        """Rows whose indexed `column` equals `value`"""
+        return self.indexes[table][column].get(value, [])
+
+    def remove(self, table: str, rows: list[dict]) -> None:
+        doomed = {id(row) for row in rows}
+        if not doomed:
+            return
+        self.tables[table] = [r for r in self.tables[table] if id(r) not in doomed]
+        for column, index in self.indexes.get(table, {}).items():
+            for row in rows:
+                bucket = index.get(row.get(column))
+                if bucket:
+                    bucket[:] = [r for r in bucket if id(r) not in doomed]
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.request_count += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = request.url.path
+        try:
+            if path.startswith("/rest/v1/rpc/"):
+                return self._rpc(request, path.rsplit("/", 1)[-1])
+            if path.startswith("/rest/v1/"):
+                return self._rest(request, path[len("/rest/v1/"):])
+            if path.startswith("/auth/v1/"):
+                return self._auth(request, path[len("/auth/v1/"):])
+        except Exception as exc:  # surfaced as a PostgREST style error
+            return httpx.Response(400, json={"message": str(exc), "code": "FAKE", "hint": None,
+                                             "details": None})
+        return httpx.Response(404, json={"message": "not found"})
+
+    def _filters(self, params: list[tuple[str, str]]):
+        reserved = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+        return [(k, v) for k, v in params
+                if k not in reserved and k.rpartition(".")[2] not in reserved]
+
+    def _index(self, index: dict, table: str, column: str) -> dict:
+        """`table` rows grouped by `column`, built once per query"""
+        if column in self.indexes.get(table, {}):
+            return self.indexes[table][column]
+        key = (table, column)
+        if key not in index:
+            groups = index[key] = {}
+            for row in self.tables.get(table, []):
+                groups.setdefault(row.get(column), []).append(row)
+        return index[key]
+
+    def _embed(self, table: str, row: dict, select: str, index: dict | None = None) -> dict | None:
+        """Project `row` and resolve `rel(cols)` / `rel!inner(cols)` embeds"""
+        index = {} if index is None else index
+        out = {}
+        for item in _split_top(select):
+            item = item.strip()
+            if not item:
+                continue
+            if "(" in item:
+                name, _, cols = item.partition("(")
+                cols = cols[:-1]
+                inner = "!inner" in name
+                name = name.split("!")[0].split(":")[-1]
+                if (table, name) in FOREIGN_KEYS:  # many-to-one
+                    fk = FOREIGN_KEYS[(table, name)]
+                    parents = self._index(index, name, "id").get(row.get(fk), [])
+                    parent = parents[0] if parents else None
+                    out[name] = self._embed(name, parent, cols, index) if parent else None
+                    if inner and parent is None:
+                        return None
+                else:  # one-to-many
+                    fk = FOREIGN_KEYS[(name, table)]
+                    children = [self._embed(name, r, cols, index)
+                                for r in self._index(index, name, fk).get(row["id"], [])]
+                    out[name] = children
+                    if inner and not children:
+                        return None
+            elif item == "*":
+                out.update(row)
+            else:
+                alias, _, column = item.rpartition(":")
+                column = column.split("::")[0]
+                out[alias or column] = row.get(column)
+        return out
+
+    def _matches(self, row: dict, filters) -> bool:
+        for key, expr in filters:
+            if key == "or":
+                if not _logic(row, expr, "or"):
+                    return False
+            elif key == "and":
+                if not _logic(row, expr, "and"):
+                    return False
+            elif "." in key:  # filter on an embedded resource
+                rel, _, column = key.partition(".")
+                target = row.get(rel)
+                if target is None:
+                    return False
+                items = target if isinstance(target, list) else [target]
+                if not any(_compare(item, column, expr) for item in items):
+                    return False
+            elif not _compare(row, key, expr):
+                return False
+        return True
+
+    def _candidates(self, table: str, filters) -> list[dict]:
+        """Narrow the scan with an indexed `eq` / `in` filter when there is one"""
+        for column, expr in filters:
+            if column not in self.indexes.get(table, {}):
+                continue
+            op, _, raw = expr.partition(".")
+            if op == "eq":
+                return list(self.lookup(table, column, _unquote(raw)))
+            if op == "in":
+                return [row for value in _in_values(raw) for row in self.lookup(table, column, value)]
+        return self.tables.get(table, [])
+
+    def _query(self, table: str, params: list[tuple[str, str]]) -> tuple[list[dict], int]:
+        qp = dict(params)
+        select = qp.get("select", "*")
+        filters = self._filters(params)
+        # Filter on the row's own columns first; embeds are only resolved for survivors
+        own = [(k, v) for k, v in filters if "." not in k]
+        embedded = [(k, v) for k, v in filters if "." in k]
+        index: dict = {}
+        rows = []
+        for row in self._candidates(table, own):
+            if not self._matches(row, own):
+                continue
+            projected = self._embed(table, row, select, index)
+            if projected is None:
+                continue
+            if embedded and not self._matches({**row, **projected}, embedded):
+                continue
+            rows.append((row, projected))
+        if "order" in qp:
+            for clause in reversed(qp["order"].split(",")):
+                column, *mods = clause.split(".")
+                desc = "desc" in mods
+                rows.sort(key=lambda pair: (pair[0].get(column) is None, pair[0].get(column) or ""),
+                          reverse=desc)
+        total = len(rows)
+        offset = int(qp.get("offset", 0))
+        if "limit" in qp:
+            rows = rows[offset:offset + int(qp["limit"])]
+        else:
+            rows = rows[offset:]
+        return rows, total
+
+    def _respond(self, request: httpx.Request, data: list[dict], total: int | None = None,
+                 status: int = 200) -> httpx.Response:
+        headers = {}
+        prefer = request.headers.get("prefer", "")
+        if "count=" in prefer:
+            end = max(len(data) - 1, 0)
+            headers["content-range"] = f"0-{end}/{total if total is not None else len(data)}"
+        if request.headers.get("accept") == "application/vnd.pgrst.object+json":
+            if len(data) != 1:
+                return httpx.Response(406, json={
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                    "code": "PGRST116", "hint": None,
+                    "details": f"The result contains {len(data)} rows"})
+            return httpx.Response(status, json=data[0], headers=headers)
+        if request.method == "HEAD":
+            return httpx.Response(status, headers=headers)
+        return httpx.Response(status, json=data, headers=headers)
+
+    def _rest(self, request: httpx.Request, table: str) -> httpx.Response:
+        params = list(parse_qsl(request.url.query.decode(), keep_blank_values=True))
+        prefer = request.headers.get("prefer", "")
+        if request.method in ("GET", "HEAD"):
+            rows, total = self._query(table, params)
+            return self._respond(request, [p for _, p in rows], total)
+
+        select = dict(params).get("select", "*")
+        if request.method == "POST":
+            body = json.loads(request.content or b"[]")
+            body = body if isinstance(body, list) else [body]
+            on_conflict = dict(params).get("on_conflict", "id")
+            created = []
+            for item in body:
+                existing = None
+                if "resolution=merge-duplicates" in prefer:
+                    existing = next((r for r in self.tables.get(table, [])
+                                     if str(r.get(on_conflict)) == str(item.get(on_conflict))), None)
+                if existing is not None:
+                    existing.update(item)
+                    existing["updated_at"] = _now()
+                    created.append(existing)
+                else:
+                    created.append(self.insert(table, item))
+            out = [self._embed(table, r, select) for r in created]
+            return self._respond(request, out if "return=representation" in prefer else [], status=201)
+
+        rows, _ = self._query(table, params)
+        if request.method == "PATCH":
+            patch = json.loads(request.content or b"{}")
+            for row, _ in rows:
+                row.update(patch)
+                row["updated_at"] = _now()
+            out = [self._embed(table, r, select) for r, _ in rows]
+        elif request.method == "DELETE":
+            out = [self._embed(table, r, select) for r, _ in rows]
+            self.remove(table, [r for r, _ in rows])
+            self._cascade(table, [r["id"] for r, _ in rows])
+        else:
+            return httpx.Response(405)
+        return self._respond(request, out if "return=minimal" not in prefer else [])
+
+    def _cascade(self, table: str, ids: list[str]) -> None:
+        for (child, parent), fk in FOREIGN_KEYS.items():
+            if parent == table and child in self.tables:
+                if fk in self.indexes.get(child, {}):
+                    gone = [r for value in ids for r in self.lookup(child, fk, value)]
+                else:
+                    gone = [r for r in self.tables[child] if r.get(fk) in set(ids)]
+                self.remove(child, gone)
+                self._cascade(child, [r["id"] for r in gone])
+
+    def _rpc(self, request: httpx.Request, name: str) -> httpx.Response:
+        if name not in self.rpcs:
+            return httpx.Response(404, json={"message": f"function {name} not found",
+                                             "code": "PGRST202", "hint": None, "details": None})
+        if self.service_key and request.headers.get("authorization") != f"Bearer {self.service_key}":
+            return httpx.Response(401, json={"message": f"permission denied for function {name}",
+                                             "code": "42501", "hint": None, "details": None})
+        args = json.loads(request.content or b"{}") if request.method == "POST" else dict(
+            parse_qsl(request.url.query.decode()))
+        return httpx.Response(200, json=self.rpcs[name](self, **args))
+
+    def _session(self, user_id: str, email: str) -> dict:
+        user = self._user(user_id, email)
+        return {
+            "access_token": self.issue_token(user_id, email),
+            "refresh_token": f"refresh-{user_id}",
+            "token_type": "bearer",
+            "expires_in": 3600,
+            "expires_at": int(time.time()) + 3600,
+            "user": user,
+        }
+
+    def _user(self, user_id: str, email: str) -> dict:
+        return {
+            "id": user_id, "email": email, "aud": "authenticated", "role": "authenticated",
+            "app_metadata": {}, "user_metadata": {}, "created_at": _now(),
+        }
+
+    def _auth(self, request: httpx.Request, path: str) -> httpx.Response:
+        body = json.loads(request.content or b"{}") if request.content else {}
+        if path == "signup":
+            user_id = str(uuid.uuid4())
+            self.passwords[body["email"]] = (body["password"], user_id)
+            return httpx.Response(200, json=self._session(user_id, body["email"]))
+        if path == "token":
+            grant = request.url.params.get("grant_type")
+            if grant == "password":
+                password, user_id = self.passwords.get(body.get("email"), (None, None))
+                if password is None or password != body.get("password"):
+                    return httpx.Response(400, json={"error": "invalid_grant",
+                                                     "error_description": "Invalid login credentials"})
+                return httpx.Response(200, json=self._session(user_id, body["email"]))
+            if grant == "refresh_token":
+                user_id = body["refresh_token"].removeprefix("refresh-")
+                email = next((e for e, (_, uid) in self.passwords.items() if uid == user_id), "")
+                return httpx.Response(200, json=self._session(user_id, email))
+        if path.startswith("admin/users/"):
+            user_id = path.rsplit("/", 1)[-1]
+            email = next((e for e, (_, uid) in self.passwords.items() if uid == user_id), "")
+            if request.method == "DELETE":
+                self.passwords = {e: v for e, v in self.passwords.items() if v[1] != user_id}
+                self.remove("users", list(self.lookup("users", "id", user_id)))
+                self._cascade("users", [user_id])
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json=self._user(user_id, email))
+        if path == ".well-known/jwks.json":
+            return httpx.Response(200, json={"keys": list(self.jwks)})
+        if path == "logout":
+            return httpx.Response(204)
+        if path == "health":
+            return httpx.Response(200, json={"name": "GoTrue"})
+        return httpx.Response(404, json={"message": f"unknown auth path {path}"})
\ No newline at end of file
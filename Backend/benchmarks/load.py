@@ -0,0 +1,196 @@
+"""Drive every API route under concurrent load against the in-memory Supabase backend.
+
+Run from Backend/:
+    python -m benchmarks.load [--sizes 10x3,100x5] [--concurrency 16] [--requests 200]
+                              [--latency 0.002] [--save-baseline NAME] [--baseline NAME]
+
+Reports p50/p95/p99 latency and requests/sec per endpoint and data size
+(decisions per user x options per decision). `--save-baseline` stores the results
+under benchmarks/baselines/; `--baseline` compares against a stored run and exits
+non-zero on regressions.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# The app reads its settings at import time, so point it at the fake first
+FAKE_URL = "http://fake.supabase.local"
+FAKE_JWT_SECRET = "benchmark-secret-benchmark-secret"
+FAKE_SERVICE_KEY = "benchmark-service-role"
+os.environ.update({
+    "SUPABASE_URL": FAKE_URL,
+    "SUPABASE_SERVICE_ROLE_KEY": FAKE_SERVICE_KEY,
+    "SUPABASE_JWT_SECRET": FAKE_JWT_SECRET,
+    # A handful of users drive every endpoint far past any sane per-user limit
+    "RATE_LIMIT_ENABLED": "false",
+})
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+from app.core.roles import role_cache  # noqa: E402
+from app.core.security import token_cache  # noqa: E402
+from app.db.supabase import close_supabase, connect_supabase, get_supabase  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.fake_supabase import FakeSupabase  # noqa: E402
+from benchmarks.workloads import ENDPOINTS, Dataset  # noqa: E402
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+async def run_endpoint(client: httpx.AsyncClient, data: Dataset, recipe, requests: int,
+                       concurrency: int) -> dict:
+    """Issue `requests` calls from `concurrency` workers; only the HTTP call is timed"""
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, path, kwargs, expected = recipe(data)
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != expected:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def run_size(decisions: int, options: int, args) -> dict[str, dict]:
+    """Benchmark every endpoint against a fresh backend seeded at one data size"""
+    fake = FakeSupabase(url=FAKE_URL, jwt_secret=FAKE_JWT_SECRET, latency=args.latency,
+                        service_key=FAKE_SERVICE_KEY)
+    data = Dataset(fake, args.users, decisions, options)
+    token_cache.clear()
+    role_cache.clear()
+    await connect_supabase(transport=fake.transport())
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, recipe in ENDPOINTS.items():
+                if args.endpoint and not any(part in name for part in args.endpoint):
+                    continue
+                results[name] = await run_endpoint(client, data, recipe, args.requests, args.concurrency)
+        # User sign-ins must not leak their token into the shared service-role client
+        authorization = get_supabase().options.headers.get("Authorization")
+        if authorization != f"Bearer {FAKE_SERVICE_KEY}":
+            raise RuntimeError(f"Shared Supabase client lost the service key: {authorization!r}")
+    finally:
+        await close_supabase()
+    return results
+
+
+def print_results(results: dict[str, dict[str, dict]]) -> None:
+    for size, endpoints in results.items():
+        print(f"\n{size}")
+        print(f"  {'endpoint':34s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'req/s':>9s} {'errors':>7s}")
+        for name, stats in endpoints.items():
+            print(
+                f"  {name:34s} {stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} {stats['p99_ms']:8.2f}"
+                f" {stats['rps']:9.1f} {stats['errors']:7d}"
+            )
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list[str]:
+    """Regressions of `results` against `baseline`: slower p95 or lower throughput"""
+    regressions = []
+    for size, endpoints in results.items():
+        for name, stats in endpoints.items():
+            before = baseline.get(size, {}).get(name)
+            if before is None:
+                continue
+            p95_delta = stats["p95_ms"] - before["p95_ms"]
+            if p95_delta > min_delta_ms and stats["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append(f"{size} {name}: p95 {before['p95_ms']:.2f} -> {stats['p95_ms']:.2f} ms")
+            if stats["rps"] < before["rps"] * (1 - tolerance):
+                regressions.append(f"{size} {name}: {before['rps']:.1f} -> {stats['rps']:.1f} req/s")
+            if stats["errors"] > before["errors"]:
+                regressions.append(f"{size} {name}: errors {before['errors']} -> {stats['errors']}")
+    return regressions
+
+
+def parse_sizes(value: str) -> list[tuple[int, int]]:
+    sizes = []
+    for item in value.split(","):
+        decisions, _, options = item.partition("x")
+        sizes.append((int(decisions), int(options or 0)))
+    return sizes
+
+
+async def run(args) -> dict[str, dict[str, dict]]:
+    results = {}
+    for decisions, options in parse_sizes(args.sizes):
+        size = f"{decisions} decisions x {options} options"
+        results[size] = await run_size(decisions, options, args)
+        print_results({size: results[size]})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10x3,100x5",
+                        help="comma separated DECISIONSxOPTIONS data sizes (per user / per decision)")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint and size")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.002,
+                        help="seconds the fake backend sleeps before each response")
+    parser.add_argument("--endpoint", action="append",
+                        help="only run endpoints whose name contains this text (repeatable)")
+    parser.add_argument("--save-baseline", metavar="NAME")
+    parser.add_argument("--baseline", metavar="NAME", help="compare against a stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative p95 / throughput change before failing")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore p95 increases smaller than this")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        path = BASELINE_DIR / f"{args.save_baseline}.json"
+        path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nBaseline saved to {path}")
+
+    if args.baseline:
+        baseline = json.loads((BASELINE_DIR / f"{args.baseline}.json").read_text())
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against baseline '{args.baseline}':")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions against baseline '{args.baseline}'")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""Per-request serialization CPU for a GET /decisions page of 500 decisions.
+
+Run from Backend/:  python -m benchmarks.serialization [--decisions N] [--options N]
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from app.core.serialization import decision_page_serializer
+from app.schemas.decision import DecisionPage
+
+
+def build_page(decisions: int, options: int) -> dict:
+    """A page shaped like the PostgREST rows the list endpoint serializes"""
+    now = datetime.now(timezone.utc).isoformat()
+    owner_id = str(uuid.uuid4())
+    items = []
+    for index in range(decisions):
+        decision_id = str(uuid.uuid4())
+        items.append({
+            "id": decision_id,
+            "title": f"Decision {index}",
+            "description": "Weighing the trade-offs between a few reasonable choices",
+            "owner_id": owner_id,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+            "options": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "decision_id": decision_id,
+                    "option_text": f"Option {option}",
+                    "rating": option % 5 + 1,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for option in range(options)
+            ],
+        })
+    return {"items": items, "next_cursor": None}
+
+
+def measure(fn, repeat: int) -> float:
+    """Mean process CPU time per call, in milliseconds"""
+    fn()
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decisions", type=int, default=500)
+    parser.add_argument("--options", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    page = build_page(args.decisions, args.options)
+    response_model = TypeAdapter(DecisionPage)
+
+    paths = {
+        # What the routes did before: no response model, generic encoder + json.dumps
+        "jsonable_encoder + json.dumps": lambda: json.dumps(jsonable_encoder(page)).encode(),
+        # FastAPI's response_model path: validate into models, then dump to JSON
+        "response_model validate + dump_json": lambda: response_model.dump_json(
+            response_model.validate_python(page)
+        ),
+        # The list endpoints: pre-compiled serializer over the raw rows
+        "pre-compiled serializer": lambda: decision_page_serializer.dump_json(page, warnings=False),
+    }
+
+    size = len(decision_page_serializer.dump_json(page, warnings=False))
+    print(f"{args.decisions} decisions x {args.options} options, {size / 1024:.0f} KiB body")
+    baseline = None
+    for name, fn in paths.items():
+        cpu_ms = measure(fn, args.repeat)
+        baseline = baseline or cpu_ms
+        print(f"  {name:38s} {cpu_ms:8.2f} ms CPU/request  ({baseline / cpu_ms:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
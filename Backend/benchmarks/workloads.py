@@ -0,0 +1,233 @@
+"""Seed data and one request recipe per route in app/routers/."""
+import json
+import random
+import uuid
+from benchmarks.fake_supabase import FakeSupabase
+
+API = "/api/v1"
+
+
+class Dataset:
+    """Users, decisions and options seeded straight into the fake backend"""
+
+    def __init__(self, fake: FakeSupabase, users: int, decisions: int, options: int):
+        self.fake = fake
+        self.options_per_decision = options
+        self.admin_id = fake.add_user("admin@example.com", role="admin")
+        self.admin_headers = self._headers(self.admin_id, role="admin")
+        self.users: list[dict] = []
+        for index in range(users):
+            email = f"user{index}@example.com"
+            user_id = fake.add_user(email)
+            user = {"id": user_id, "email": email, "headers": self._headers(user_id), "decisions": []}
+            for _ in range(decisions):
+                user["decisions"].append(self.add_decision(user_id)["id"])
+            self.users.append(user)
+
+    def _headers(self, user_id: str, role: str | None = None) -> dict:
+        return {"Authorization": f"Bearer {self.fake.issue_token(user_id, role=role)}"}
+
+    def add_decision(self, owner_id: str) -> dict:
+        decision = self.fake.insert("decisions", {
+            "title": "Which database should we use?",
+            "description": "Weighing the trade-offs between a few reasonable choices",
+            "owner_id": owner_id,
+        })
+        for index in range(self.options_per_decision):
+            self.add_option(decision["id"], index)
+        return decision
+
+    def add_option(self, decision_id: str, index: int = 0) -> dict:
+        return self.fake.insert("decision_options", {
+            "decision_id": decision_id,
+            "option_text": f"Option {index}",
+            "rating": index % 5 + 1,
+        })
+
+    def user(self) -> dict:
+        return random.choice(self.users)
+
+    def owned_decision(self) -> tuple[dict, str]:
+        user = self.user()
+        if not user["decisions"]:
+            user["decisions"].append(self.add_decision(user["id"])["id"])
+        return user, random.choice(user["decisions"])
+
+    def owned_option(self) -> tuple[dict, str, str]:
+        user, decision_id = self.owned_decision()
+        return user, decision_id, self.add_option(decision_id)["id"]
+
+
+def _import_body(decisions: int = 10, options: int = 3) -> bytes:
+    lines = [
+        json.dumps({
+            "title": f"Imported {index}",
+            "options": [{"option_text": f"Option {n}", "rating": 3} for n in range(options)],
+        })
+        for index in range(decisions)
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+# Each recipe does its (untimed) setup against the dataset and returns
+# (method, path, httpx request kwargs, expected status)
+
+def register(data: Dataset):
+    body = {"email": f"{uuid.uuid4().hex}@example.com", "password": "password"}
+    return "POST", f"{API}/auth/register", {"json": body}, 200
+
+
+def login(data: Dataset):
+    body = {"email": data.user()["email"], "password": "password"}
+    return "POST", f"{API}/auth/login", {"json": body}, 200
+
+
+def refresh(data: Dataset):
+    body = {"refresh_token": f"refresh-{data.user()['id']}"}
+    return "POST", f"{API}/auth/refresh", {"json": body}, 200
+
+
+def me(data: Dataset):
+    return "GET", f"{API}/auth/me", {"headers": data.user()["headers"]}, 200
+
+
+def logout(data: Dataset):
+    return "POST", f"{API}/auth/logout", {"headers": data.user()["headers"]}, 200
+
+
+def create_decision(data: Dataset):
+    body = {"title": "New decision", "description": "Created by the benchmark"}
+    return "POST", f"{API}/decisions/", {"json": body, "headers": data.user()["headers"]}, 201
+
+
+def list_decisions(data: Dataset):
+    return "GET", f"{API}/decisions/", {"params": {"limit": 50}, "headers": data.user()["headers"]}, 200
+
+
+def decision_summary(data: Dataset):
+    return "GET", f"{API}/decisions/summary", {"headers": data.user()["headers"]}, 200
+
+
+def search_decisions(data: Dataset):
+    params = {"q": random.choice(["data", "which trade", "option"]), "limit": 20}
+    return "GET", f"{API}/decisions/search", {"params": params, "headers": data.user()["headers"]}, 200
+
+
+def export_decisions(data: Dataset):
+    return "GET", f"{API}/decisions/export", {"headers": data.user()["headers"]}, 200
+
+
+def import_decisions(data: Dataset):
+    kwargs = {"content": _import_body(), "headers": data.user()["headers"]}
+    return "POST", f"{API}/decisions/import", kwargs, 201
+
+
+def get_decision(data: Dataset):
+    user, decision_id = data.owned_decision()
+    return "GET", f"{API}/decisions/{decision_id}", {"headers": user["headers"]}, 200
+
+
+def update_decision(data: Dataset):
+    user, decision_id = data.owned_decision()
+    kwargs = {"json": {"title": "Renamed"}, "headers": user["headers"]}
+    return "PATCH", f"{API}/decisions/{decision_id}", kwargs, 200
+
+
+def delete_decision(data: Dataset):
+    user = data.user()
+    decision_id = data.add_decision(user["id"])["id"]
+    return "DELETE", f"{API}/decisions/{decision_id}", {"headers": user["headers"]}, 204
+
+
+def add_option(data: Dataset):
+    user, decision_id = data.owned_decision()
+    body = {"decision_id": decision_id, "option_text": "Another option", "rating": 4}
+    return "POST", f"{API}/options/", {"json": body, "headers": user["headers"]}, 201
+
+
+def add_options_bulk(data: Dataset):
+    user, decision_id = data.owned_decision()
+    body = {"decision_id": decision_id, "options": [{"option_text": f"Bulk {n}"} for n in range(5)]}
+    return "POST", f"{API}/options/bulk", {"json": body, "headers": user["headers"]}, 201
+
+
+def update_options_bulk(data: Dataset):
+    user, decision_id = data.owned_decision()
+    updates = [{"id": data.add_option(decision_id)["id"], "rating": 2} for _ in range(5)]
+    body = {"decision_id": decision_id, "updates": updates}
+    return "PATCH", f"{API}/options/bulk", {"json": body, "headers": user["headers"]}, 200
+
+
+def delete_options_bulk(data: Dataset):
+    user, decision_id = data.owned_decision()
+    option_ids = [data.add_option(decision_id)["id"] for _ in range(5)]
+    body = {"decision_id": decision_id, "option_ids": option_ids}
+    return "POST", f"{API}/options/bulk-delete", {"json": body, "headers": user["headers"]}, 200
+
+
+def list_options(data: Dataset):
+    user, decision_id = data.owned_decision()
+    return "GET", f"{API}/options/{decision_id}", {"headers": user["headers"]}, 200
+
+
+def update_option(data: Dataset):
+    user, _, option_id = data.owned_option()
+    kwargs = {"json": {"rating": 5}, "headers": user["headers"]}
+    return "PATCH", f"{API}/options/{option_id}", kwargs, 200
+
+
+def delete_option(data: Dataset):
+    user, _, option_id = data.owned_option()
+    return "DELETE", f"{API}/options/{option_id}", {"headers": user["headers"]}, 204
+
+
+def list_users(data: Dataset):
+    params = random.choice([
+        {"limit": 50},
+        {"limit": 50, "role": "user", "sort": "email", "order": "asc"},
+        {"limit": 50, "email_prefix": "user1"},
+    ])
+    return "GET", f"{API}/admin/users", {"params": params, "headers": data.admin_headers}, 200
+
+
+def update_user_role(data: Dataset):
+    kwargs = {"json": {"role": "user"}, "headers": data.admin_headers}
+    return "PATCH", f"{API}/admin/users/{data.user()['id']}/role", kwargs, 200
+
+
+def delete_user(data: Dataset):
+    user_id = data.fake.add_user(f"{uuid.uuid4().hex}@example.com")
+    return "DELETE", f"{API}/admin/users/{user_id}", {"headers": data.admin_headers}, 204
+
+
+def dashboard(data: Dataset):
+    return "GET", f"{API}/admin/dashboard", {"headers": data.admin_headers}, 200
+
+
+ENDPOINTS = {
+    "POST /auth/register": register,
+    "POST /auth/login": login,
+    "POST /auth/refresh": refresh,
+    "GET /auth/me": me,
+    "POST /auth/logout": logout,
+    "POST /decisions/": create_decision,
+    "GET /decisions/": list_decisions,
+    "GET /decisions/summary": decision_summary,
+    "GET /decisions/search": search_decisions,
+    "GET /decisions/export": export_decisions,
+    "POST /decisions/import": import_decisions,
+    "GET /decisions/{decision_id}": get_decision,
+    "PATCH /decisions/{decision_id}": update_decision,
+    "DELETE /decisions/{decision_id}": delete_decision,
+    "POST /options/": add_option,
+    "POST /options/bulk": add_options_bulk,
+    "PATCH /options/bulk": update_options_bulk,
+    "POST /options/bulk-delete": delete_options_bulk,
+    "GET /options/{decision_id}": list_options,
+    "PATCH /options/{option_id}": update_option,
+    "DELETE /options/{option_id}": delete_option,
+    "GET /admin/users": list_users,
+    "PATCH /admin/users/{user_id}/role": update_user_role,
+    "DELETE /admin/users/{user_id}": delete_user,
+    "GET /admin/dashboard": dashboard,
+}
\ No newline at end of file
@@ -70,7 +70,7 @@ export const logoutUser = () => api.post("/auth/logout");
 
 // DECISIONS ENDPOINTS
 
-export const fetchDecisions = () => api.get("/decisions");
+export const fetchDecisions = (params) => api.get("/decisions", { params });
 
 export const getDecisionById = (decisionId) => 
     api.get(`/decisions/${decisionId}`);
@@ -84,6 +84,68 @@ export const updateDecision = (decisionId, data) =>
 export const deleteDecision = (decisionId) => 
     api.delete(`/decisions/${decisionId}`);
 
+export const searchDecisions = (params) => 
+    api.get("/decisions/search", { params });
+
+export const getDecisionSummary = () => 
+    api.get("/decisions/summary");
+
+export const exportDecisions = () => 
+    api.get("/decisions/export", { responseType: "blob" });
+
+export const importDecisions = (file) => 
+    api.post("/decisions/import", file, {
+        headers: { "Content-Type": "application/x-ndjson" },
+    });
+
+// Server-Sent Events change feed. Read with fetch rather than EventSource so the
+// bearer token travels in a header. Calls onEvent({ type, data }) per event and
+// reconnects when the stream ends; returns a function that closes it.
+export const subscribeToChanges = (onEvent) => {
+    const controller = new AbortController();
+
+    const connect = async () => {
+        while (!controller.signal.aborted) {
+            try {
+                const token = localStorage.getItem("accessToken");
+                const response = await fetch(`${API_BASE_URL}/decisions/stream`, {
+                    headers: token ? { Authorization: `Bearer ${token}` } : {},
+                    signal: controller.signal,
+                });
+                if (!response.ok) throw new Error(`stream failed: ${response.status}`);
+
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                let buffer = "";
+                for (;;) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    buffer += value;
+                    const blocks = buffer.split("\n\n");
+                    buffer = blocks.pop();
+                    for (const block of blocks) {
+                        let type = "message";
+                        let data = "";
+                        for (const line of block.split("\n")) {
+                            if (line.startsWith("event: ")) type = line.slice(7);
+                            else if (line.startsWith("data: ")) data += line.slice(6);
+                        }
+                        if (data) onEvent({ type, data: JSON.parse(data) });
+                    }
+                }
+                // Events published while disconnected are not replayed
+                onEvent({ type: "resync", data: {} });
+            } catch (error) {
+                if (controller.signal.aborted) return;
+                console.error("[API] Change stream error:", error);
+            }
+            await new Promise((resolve) => setTimeout(resolve, 3000));
+        }
+    };
+
+    connect();
+    return () => controller.abort();
+};
+
 // OPTIONS ENDPOINTS
 
 export const addOption = (data) => 
@@ -98,9 +160,18 @@ export const updateOption = (optionId, data) =>
 export const deleteOption = (optionId) => 
     api.delete(`/options/${optionId}`);
 
+export const addOptionsBulk = (data) => 
+    api.post("/options/bulk", data);
+
+export const updateOptionsBulk = (data) => 
+    api.patch("/options/bulk", data);
+
+export const deleteOptionsBulk = (data) => 
+    api.post("/options/bulk-delete", data);
+
 // ADMIN ENDPOINTS
 
-export const getAllUsers = () => api.get("/admin/users");
+export const getAllUsers = (params) => api.get("/admin/users", { params });
 
 export const updateUserRole = (userId, data) => 
     api.patch(`/admin/users/${userId}/role`, data);
@@ -17,7 +17,9 @@ export default function UserDashboard() {
     const navigate = useNavigate();
 
     const [decisions, setDecisions] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState('');
 
     // Create decision form
@@ -44,7 +46,8 @@ export default function UserDashboard() {
         try {
             setLoading(true);
             const response = await fetchDecisions();
-            setDecisions(response.data || []);
+            setDecisions(response.data?.items || []);
+            setNextCursor(response.data?.next_cursor || null);
             setError('');
         } catch (err) {
             setError('Failed to load decisions');
@@ -54,6 +57,23 @@ export default function UserDashboard() {
         }
     };
 
+    // The list is paginated: each page's next_cursor fetches the one after it
+    const loadMoreDecisions = async () => {
+        if (!nextCursor) return;
+        try {
+            setLoadingMore(true);
+            const response = await fetchDecisions({ cursor: nextCursor });
+            setDecisions((previous) => [...previous, ...(response.data?.items || [])]);
+            setNextCursor(response.data?.next_cursor || null);
+            setError('');
+        } catch (err) {
+            setError('Failed to load more decisions');
+            console.error(err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleCreateDecision = async (e) => {
         e.preventDefault();
         if (!formData.title.trim()) {
@@ -245,6 +265,15 @@ export default function UserDashboard() {
                                     </button>
                                 </div>
                             ))}
+                            {nextCursor && (
+                                <button
+                                    onClick={loadMoreDecisions}
+                                    className="btn-secondary btn-load-more"
+                                    disabled={loadingMore}
+                                >
+                                    {loadingMore ? 'Loading...' : 'Load more'}
+                                </button>
+                            )}
                         </div>
                     )}
                 </div>
@@ -14,8 +14,10 @@ function AdminDashboard() {
     const navigate = useNavigate();
 
     const [users, setUsers] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [stats, setStats] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState('');
 
     useEffect(() => {
@@ -29,7 +31,8 @@ function AdminDashboard() {
                 getAllUsers(),
                 getAdminDashboard(),
             ]);
-            setUsers(usersRes.data || []);
+            setUsers(usersRes.data?.items || []);
+            setNextCursor(usersRes.data?.next_cursor || null);
             setStats(statsRes.data);
             setError('');
         } catch (err) {
@@ -40,6 +43,23 @@ function AdminDashboard() {
         }
     };
 
+    // The user list is paginated: each page's next_cursor fetches the one after it
+    const loadMoreUsers = async () => {
+        if (!nextCursor) return;
+        try {
+            setLoadingMore(true);
+            const response = await getAllUsers({ cursor: nextCursor });
+            setUsers((previous) => [...previous, ...(response.data?.items || [])]);
+            setNextCursor(response.data?.next_cursor || null);
+            setError('');
+        } catch (err) {
+            setError('Failed to load more users');
+            console.error(err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handlePromoteUser = async (userId) => {
         try {
             await updateUserRole(userId, { role: 'admin' });
@@ -160,6 +180,15 @@ function AdminDashboard() {
                                 ))}
                             </div>
                         )}
+                        {nextCursor && (
+                            <button
+                                onClick={loadMoreUsers}
+                                className="btn-load-more"
+                                disabled={loadingMore}
+                            >
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </button>
+                        )}
                     </div>
                 </>
             )}
@@ -17,6 +17,14 @@ CREATE TABLE IF NOT EXISTS users (
 --Create index for faster role queries
 CREATE INDEX IF NOT EXISTS idx_users_role ON users(role);
 
+--Create index for keyset pagination of the admin user listing
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users(created_at DESC, id DESC);
+
+--Create indexes for email sorting and prefix filtering in the admin user listing
+--(Supabase Auth stores emails lowercased, so a case-sensitive LIKE prefix works)
+CREATE INDEX IF NOT EXISTS idx_users_email_id ON users(email, id);
+CREATE INDEX IF NOT EXISTS idx_users_email_pattern ON users(email text_pattern_ops);
+
 --============================================================================
 --2. DECISIONS TABLE
 --============================================================================
@@ -33,6 +41,9 @@ CREATE TABLE IF NOT EXISTS decisions (
 --Create index for faster queries by owner
 CREATE INDEX IF NOT EXISTS idx_decisions_owner_id ON decisions(owner_id);
 
+--Create index for keyset pagination of a user's decisions
+CREATE INDEX IF NOT EXISTS idx_decisions_owner_created_at_id ON decisions(owner_id, created_at DESC, id DESC);
+
 --============================================================================
 --3. DECISION_OPTIONS TABLE
 --============================================================================
@@ -146,12 +157,509 @@ CREATE POLICY "Users can delete options from their decisions"
     )
   );
 
+--============================================================================
+--UPDATED_AT MAINTENANCE
+--============================================================================
+--updated_at is the version behind the API's ETags, so keep it current on every
+--write path (API, bulk functions, imports, manual edits)
+CREATE OR REPLACE FUNCTION public.set_updated_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.updated_at = CURRENT_TIMESTAMP;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS set_decisions_updated_at ON decisions;
+CREATE TRIGGER set_decisions_updated_at
+  BEFORE UPDATE ON decisions
+  FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+DROP TRIGGER IF EXISTS set_decision_options_updated_at ON decision_options;
+CREATE TRIGGER set_decision_options_updated_at
+  BEFORE UPDATE ON decision_options
+  FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+--============================================================================
+--OWNERSHIP-SCOPED OPTION MUTATIONS
+--============================================================================
+--The backend calls these with the service role key. Each one joins the option
+--to its decision on owner_id, so the ownership check and the write run as a
+--single statement. An empty result means the row is missing or not owned.
+
+CREATE OR REPLACE FUNCTION public.add_owned_option(
+  p_owner_id UUID,
+  p_decision_id UUID,
+  p_option_text TEXT,
+  p_rating INTEGER DEFAULT NULL
+)
+RETURNS SETOF decision_options
+LANGUAGE sql
+AS $$
+  INSERT INTO decision_options (decision_id, option_text, rating)
+  SELECT d.id, p_option_text, p_rating
+  FROM decisions d
+  WHERE d.id = p_decision_id AND d.owner_id = p_owner_id
+  RETURNING *;
+$$;
+
+--NULL arguments leave the column unchanged
+CREATE OR REPLACE FUNCTION public.update_owned_option(
+  p_owner_id UUID,
+  p_option_id UUID,
+  p_option_text TEXT DEFAULT NULL,
+  p_rating INTEGER DEFAULT NULL
+)
+RETURNS SETOF decision_options
+LANGUAGE sql
+AS $$
+  UPDATE decision_options o
+  SET option_text = COALESCE(p_option_text, o.option_text),
+      rating = COALESCE(p_rating, o.rating),
+      updated_at = CURRENT_TIMESTAMP
+  FROM decisions d
+  WHERE o.id = p_option_id
+    AND d.id = o.decision_id
+    AND d.owner_id = p_owner_id
+  RETURNING o.*;
+$$;
+
+CREATE OR REPLACE FUNCTION public.delete_owned_option(
+  p_owner_id UUID,
+  p_option_id UUID
+)
+RETURNS SETOF decision_options
+LANGUAGE sql
+AS $$
+  DELETE FROM decision_options o
+  USING decisions d
+  WHERE o.id = p_option_id
+    AND d.id = o.decision_id
+    AND d.owner_id = p_owner_id
+  RETURNING o.*;
+$$;
+
+--Bulk variants: one multi-row statement per request, scoped to one decision
+--(update_owned_options accepts a NULL decision to apply coalesced single-option
+--updates that span several of the owner's decisions)
+CREATE OR REPLACE FUNCTION public.add_owned_options(
+  p_owner_id UUID,
+  p_decision_id UUID,
+  p_options JSONB
+)
+RETURNS SETOF decision_options
+LANGUAGE sql
+AS $$
+  --Options are read back ordered by created_at, and every row of one statement
+  --shares CURRENT_TIMESTAMP, so each gets one microsecond per input position
+  INSERT INTO decision_options (decision_id, option_text, rating, created_at)
+  SELECT d.id, x.option_text, x.rating, CURRENT_TIMESTAMP + x.ord * INTERVAL '1 microsecond'
+  FROM decisions d
+  CROSS JOIN LATERAL ROWS FROM (
+    jsonb_to_recordset(p_options) AS (option_text TEXT, rating INTEGER)
+  ) WITH ORDINALITY AS x(option_text, rating, ord)
+  WHERE d.id = p_decision_id AND d.owner_id = p_owner_id
+  ORDER BY x.ord
+  RETURNING *;
+$$;
+
+CREATE OR REPLACE FUNCTION public.update_owned_options(
+  p_owner_id UUID,
+  p_decision_id UUID,
+  p_updates JSONB
+)
+RETURNS SETOF decision_options
+LANGUAGE sql
+AS $$
+  UPDATE decision_options o
+  SET option_text = COALESCE(x.option_text, o.option_text),
+      rating = COALESCE(x.rating, o.rating),
+      updated_at = CURRENT_TIMESTAMP
+  FROM jsonb_to_recordset(p_updates) AS x(id UUID, option_text TEXT, rating INTEGER),
+       decisions d
+  WHERE o.id = x.id
+    AND (p_decision_id IS NULL OR o.decision_id = p_decision_id)
+    AND d.id = o.decision_id
+    AND d.owner_id = p_owner_id
+  RETURNING o.*;
+$$;
+
+CREATE OR REPLACE FUNCTION public.delete_owned_options(
+  p_owner_id UUID,
+  p_decision_id UUID,
+  p_option_ids UUID[]
+)
+RETURNS SETOF decision_options
+LANGUAGE sql
+AS $$
+  DELETE FROM decision_options o
+  USING decisions d
+  WHERE o.id = ANY(p_option_ids)
+    AND o.decision_id = p_decision_id
+    AND d.id = o.decision_id
+    AND d.owner_id = p_owner_id
+  RETURNING o.*;
+$$;
+
+--NDJSON import: one batch of decisions and their options in a single statement,
+--so a batch is stored completely or not at all. Decision ids are generated up
+--front to link each option to its decision. Exported created_at values are
+--kept; missing ones are spaced one microsecond apart in input order, so reads
+--ordered by created_at return rows as they appeared in the file.
+CREATE OR REPLACE FUNCTION public.import_owned_decisions(
+  p_owner_id UUID,
+  p_decisions JSONB
+)
+RETURNS TABLE (
+  decisions_imported INTEGER,
+  options_imported INTEGER
+)
+LANGUAGE sql
+AS $$
+  WITH input AS MATERIALIZED (
+    SELECT gen_random_uuid() AS id, x.item, x.ord
+    FROM jsonb_array_elements(p_decisions) WITH ORDINALITY AS x(item, ord)
+  ),
+  new_decisions AS (
+    INSERT INTO decisions (id, owner_id, title, description, is_active, created_at)
+    SELECT i.id,
+           p_owner_id,
+           i.item->>'title',
+           i.item->>'description',
+           coalesce((i.item->>'is_active')::BOOLEAN, true),
+           coalesce((i.item->>'created_at')::TIMESTAMPTZ,
+                    CURRENT_TIMESTAMP + i.ord * INTERVAL '1 microsecond')
+    FROM input i
+    ORDER BY i.ord
+    RETURNING id
+  ),
+  new_options AS (
+    INSERT INTO decision_options (decision_id, option_text, rating, created_at)
+    SELECT i.id,
+           o.option->>'option_text',
+           (o.option->>'rating')::INTEGER,
+           coalesce((o.option->>'created_at')::TIMESTAMPTZ,
+                    CURRENT_TIMESTAMP + o.ord * INTERVAL '1 microsecond')
+    FROM input i
+    CROSS JOIN LATERAL jsonb_array_elements(coalesce(i.item->'options', '[]'::JSONB))
+      WITH ORDINALITY AS o(option, ord)
+    ORDER BY i.ord, o.ord
+    RETURNING id
+  )
+  SELECT (SELECT count(*) FROM new_decisions)::INTEGER,
+         (SELECT count(*) FROM new_options)::INTEGER;
+$$;
+
+--The owner id is a trusted argument, so only the backend may call these
+REVOKE EXECUTE ON FUNCTION public.add_owned_option(UUID, UUID, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.update_owned_option(UUID, UUID, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.delete_owned_option(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.add_owned_option(UUID, UUID, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION public.update_owned_option(UUID, UUID, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION public.delete_owned_option(UUID, UUID) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.add_owned_options(UUID, UUID, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.update_owned_options(UUID, UUID, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.delete_owned_options(UUID, UUID, UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.add_owned_options(UUID, UUID, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION public.update_owned_options(UUID, UUID, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION public.delete_owned_options(UUID, UUID, UUID[]) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.import_owned_decisions(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.import_owned_decisions(UUID, JSONB) TO service_role;
+
+--============================================================================
+--ADMIN STATISTICS COUNTERS
+--============================================================================
+--Counters behind /admin/dashboard, kept current by triggers so the dashboard
+--is a single primary-key read instead of COUNT(*) scans.
+CREATE TABLE IF NOT EXISTS app_stats (
+  key TEXT PRIMARY KEY,
+  value BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+--Only the service role reads the counters
+ALTER TABLE app_stats ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.app_stats_add(stat_key TEXT, delta BIGINT)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE app_stats
+  SET value = value + delta, updated_at = CURRENT_TIMESTAMP
+  WHERE key = stat_key AND delta <> 0;
+$$;
+
+--Statement-level triggers: one counter update per INSERT/DELETE statement,
+--so bulk writes and cascading deletes do not update the row once per row
+CREATE OR REPLACE FUNCTION public.app_stats_count_inserted()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  PERFORM public.app_stats_add(TG_ARGV[0], (SELECT count(*) FROM new_rows));
+  RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.app_stats_count_deleted()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  PERFORM public.app_stats_add(TG_ARGV[0], -(SELECT count(*) FROM old_rows));
+  RETURN NULL;
+END;
+$$;
+
+--Users also track the admin count, including role changes
+CREATE OR REPLACE FUNCTION public.app_stats_track_users()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM public.app_stats_add('total_users', 1);
+    PERFORM public.app_stats_add('total_admins', CASE WHEN NEW.role = 'admin' THEN 1 ELSE 0 END);
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM public.app_stats_add('total_users', -1);
+    PERFORM public.app_stats_add('total_admins', CASE WHEN OLD.role = 'admin' THEN -1 ELSE 0 END);
+  ELSIF NEW.role IS DISTINCT FROM OLD.role THEN
+    PERFORM public.app_stats_add(
+      'total_admins',
+      (CASE WHEN NEW.role = 'admin' THEN 1 ELSE 0 END) - (CASE WHEN OLD.role = 'admin' THEN 1 ELSE 0 END)
+    );
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+--Counters are only written by the triggers above (which run as the function
+--owner), never over /rest/v1/rpc
+REVOKE EXECUTE ON FUNCTION public.app_stats_add(TEXT, BIGINT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.app_stats_count_inserted() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.app_stats_count_deleted() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.app_stats_track_users() FROM PUBLIC, anon, authenticated;
+
+DROP TRIGGER IF EXISTS app_stats_users ON users;
+CREATE TRIGGER app_stats_users
+  AFTER INSERT OR DELETE OR UPDATE OF role ON users
+  FOR EACH ROW EXECUTE FUNCTION public.app_stats_track_users();
+
+DROP TRIGGER IF EXISTS app_stats_decisions_insert ON decisions;
+CREATE TRIGGER app_stats_decisions_insert
+  AFTER INSERT ON decisions
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.app_stats_count_inserted('total_decisions');
+
+DROP TRIGGER IF EXISTS app_stats_decisions_delete ON decisions;
+CREATE TRIGGER app_stats_decisions_delete
+  AFTER DELETE ON decisions
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.app_stats_count_deleted('total_decisions');
+
+DROP TRIGGER IF EXISTS app_stats_options_insert ON decision_options;
+CREATE TRIGGER app_stats_options_insert
+  AFTER INSERT ON decision_options
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.app_stats_count_inserted('total_options');
+
+DROP TRIGGER IF EXISTS app_stats_options_delete ON decision_options;
+CREATE TRIGGER app_stats_options_delete
+  AFTER DELETE ON decision_options
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.app_stats_count_deleted('total_options');
+
+--Seed (or re-sync) the counters from the current table contents
+INSERT INTO app_stats (key, value) VALUES
+  ('total_users', (SELECT count(*) FROM users)),
+  ('total_admins', (SELECT count(*) FROM users WHERE role = 'admin')),
+  ('total_decisions', (SELECT count(*) FROM decisions)),
+  ('total_options', (SELECT count(*) FROM decision_options))
+ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP;
+
 --Create trigger for auth.users
 DROP TRIGGER IF EXISTS on_auth_user_created ON auth.users;
 CREATE TRIGGER on_auth_user_created
   AFTER INSERT ON auth.users
   FOR EACH ROW EXECUTE FUNCTION public.handle_new_user();
 
+--============================================================================
+--DECISION RATING SUMMARIES
+--============================================================================
+--Per-decision rating aggregates for /decisions/summary, computed in one
+--grouped pass over the owner's options so the API never loads option rows.
+--rating_counts[n] is the number of options rated n (1-5).
+CREATE OR REPLACE FUNCTION public.decision_rating_summaries(p_owner_id UUID)
+RETURNS TABLE (
+  decision_id UUID,
+  title TEXT,
+  is_active BOOLEAN,
+  option_count INTEGER,
+  unrated_count INTEGER,
+  mean_rating NUMERIC,
+  median_rating DOUBLE PRECISION,
+  top_option_id UUID,
+  top_option_text TEXT,
+  top_rating INTEGER,
+  rating_counts INTEGER[]
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    d.id,
+    d.title,
+    d.is_active,
+    count(o.id)::INTEGER,
+    (count(o.id) - count(o.rating))::INTEGER,
+    round(avg(o.rating), 2),
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY o.rating),
+    (array_agg(o.id ORDER BY o.rating DESC, o.created_at, o.id) FILTER (WHERE o.rating IS NOT NULL))[1],
+    (array_agg(o.option_text ORDER BY o.rating DESC, o.created_at, o.id) FILTER (WHERE o.rating IS NOT NULL))[1],
+    max(o.rating),
+    ARRAY[
+      count(*) FILTER (WHERE o.rating = 1),
+      count(*) FILTER (WHERE o.rating = 2),
+      count(*) FILTER (WHERE o.rating = 3),
+      count(*) FILTER (WHERE o.rating = 4),
+      count(*) FILTER (WHERE o.rating = 5)
+    ]::INTEGER[]
+  FROM decisions d
+  LEFT JOIN decision_options o ON o.decision_id = d.id
+  WHERE d.owner_id = p_owner_id
+  GROUP BY d.id
+  ORDER BY d.created_at DESC, d.id DESC;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.decision_rating_summaries(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.decision_rating_summaries(UUID) TO service_role;
+
+--============================================================================
+--FULL-TEXT SEARCH
+--============================================================================
+--Expression GIN indexes over the searchable text, so /decisions/search never
+--scans a user's decisions and the tsvectors are not returned by select=*.
+--The 'simple' configuration keeps every word (no stemming or stop words),
+--which makes prefix queries like 'data:*' behave predictably.
+CREATE OR REPLACE FUNCTION public.decision_search_vector(p_title TEXT, p_description TEXT)
+RETURNS tsvector
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT setweight(to_tsvector('simple'::regconfig, coalesce(p_title, '')), 'A')
+      || setweight(to_tsvector('simple'::regconfig, coalesce(p_description, '')), 'B');
+$$;
+
+CREATE OR REPLACE FUNCTION public.option_search_vector(p_option_text TEXT)
+RETURNS tsvector
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT setweight(to_tsvector('simple'::regconfig, coalesce(p_option_text, '')), 'C');
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_decisions_search
+  ON decisions USING GIN (public.decision_search_vector(title, description));
+CREATE INDEX IF NOT EXISTS idx_decision_options_search
+  ON decision_options USING GIN (public.option_search_vector(option_text));
+
+--p_query is a to_tsquery expression built by the backend (terms AND-ed, each
+--a prefix match). A decision matches on its own text or any option's text and
+--is ranked by the better of the two.
+CREATE OR REPLACE FUNCTION public.search_decisions(
+  p_owner_id UUID,
+  p_query TEXT,
+  p_limit INTEGER DEFAULT 20,
+  p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+  id UUID,
+  title TEXT,
+  description TEXT,
+  is_active BOOLEAN,
+  created_at TIMESTAMP WITH TIME ZONE,
+  updated_at TIMESTAMP WITH TIME ZONE,
+  rank REAL,
+  matched_options TEXT[]
+)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH q AS (
+    SELECT to_tsquery('simple'::regconfig, p_query) AS query
+  ),
+  decision_hits AS (
+    SELECT d.id, ts_rank(public.decision_search_vector(d.title, d.description), q.query) AS rank
+    FROM decisions d, q
+    WHERE d.owner_id = p_owner_id
+      AND public.decision_search_vector(d.title, d.description) @@ q.query
+  ),
+  option_hits AS (
+    SELECT o.decision_id AS id,
+           max(ts_rank(public.option_search_vector(o.option_text), q.query)) AS rank,
+           array_agg(o.option_text ORDER BY o.created_at) AS matched_options
+    FROM decision_options o
+    JOIN decisions d ON d.id = o.decision_id, q
+    WHERE d.owner_id = p_owner_id
+      AND public.option_search_vector(o.option_text) @@ q.query
+    GROUP BY o.decision_id
+  ),
+  hits AS (
+    SELECT coalesce(dh.id, oh.id) AS id,
+           greatest(coalesce(dh.rank, 0), coalesce(oh.rank, 0)) AS rank,
+           coalesce(oh.matched_options, '{}') AS matched_options
+    FROM decision_hits dh
+    FULL JOIN option_hits oh ON oh.id = dh.id
+  )
+  SELECT d.id, d.title, d.description, d.is_active, d.created_at, d.updated_at,
+         h.rank, h.matched_options
+  FROM hits h
+  JOIN decisions d ON d.id = h.id
+  ORDER BY h.rank DESC, d.created_at DESC, d.id DESC
+  LIMIT p_limit OFFSET p_offset;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.search_decisions(UUID, TEXT, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.search_decisions(UUID, TEXT, INTEGER, INTEGER) TO service_role;
+
+--============================================================================
+--ADMIN USER ACTIVITY
+--============================================================================
+--Decision and option counts for one page of the admin user listing, grouped
+--in a single query over the owner_id and decision_id indexes. Users without
+--decisions are omitted (the backend reports zero for them).
+CREATE OR REPLACE FUNCTION public.user_activity_counts(p_user_ids UUID[])
+RETURNS TABLE (
+  user_id UUID,
+  decision_count INTEGER,
+  option_count INTEGER
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    d.owner_id,
+    count(DISTINCT d.id)::INTEGER,
+    count(o.id)::INTEGER
+  FROM decisions d
+  LEFT JOIN decision_options o ON o.decision_id = d.id
+  WHERE d.owner_id = ANY(p_user_ids)
+  GROUP BY d.owner_id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.user_activity_counts(UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.user_activity_counts(UUID[]) TO service_role;
+
 --============================================================================
 --SUMMARY OF TABLES AND FIELDS
 --============================================================================
@@ -180,4 +688,9 @@ CREATE TRIGGER on_auth_user_created
 --  - created_at (TIMESTAMP)
 --  - updated_at (TIMESTAMP)
 --
+--TABLE: app_stats
+--  - key (TEXT, PK: total_users, total_admins, total_decisions, total_options)
+--  - value (BIGINT, trigger-maintained)
+--  - updated_at (TIMESTAMP)
+--
 --============================================================================